@@ -55,9 +55,16 @@ def set_winshot_fn(callback: Callable[[str], bytes] | None) -> None:
     _default.set_winshot_fn(callback)
 
 
-def start(*, port: int = 0, host: str = 'localhost', readonly: bool = False, app_id: str | None = None) -> None:
+def start(
+    *,
+    port: int = 0,
+    host: str = 'localhost',
+    readonly: bool = False,
+    app_id: str | None = None,
+    unix_path: str | None = None,
+) -> None:
     """Start the devtools inspection server on the default instance."""
-    _default.start(port=port, host=host, readonly=readonly, app_id=app_id)
+    _default.start(port=port, host=host, readonly=readonly, app_id=app_id, unix_path=unix_path)
 
 
 def add_arguments(parser) -> None:
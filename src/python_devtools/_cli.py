@@ -7,24 +7,20 @@ CLI entry point — two modes:
     This mode never launches target apps.
 
 2. Wrapper mode (with --):
-    python-devtools [--app-id APP_ID] [--port PORT] [--readonly] -- <command>
+    python-devtools [--app-id APP_ID] [--port PORT] [--socket PATH] [--readonly] -- <command>
     Injects devtools into a child Python process via sitecustomize.py.
 """
 
 from __future__ import annotations
 
 import argparse
-import json
-import socket
+import functools
 import sys
-import threading
-import time
 from typing import Any
 
-from python_devtools._registry import list_registered_apps, unregister_app
-
-# 10 MB — guard against runaway responses filling memory
-_MAX_BUF = 10 * 1024 * 1024
+# Socket timeout floor for screenshot/winshot — captures run on the app's
+# main thread and encode a PNG, which can outlast the default timeout
+_CAPTURE_TIMEOUT = 60.0
 _RUN_DEFAULT_MAX_RESULT_CHARS = 0
 _RUN_DEFAULT_MAX_RESULT_LINES = 0
 
@@ -35,227 +31,117 @@ def _fmt(result):
     Return structured objects directly so MCP clients can render them without
     JSON-string escaping noise. Scalars are stringified for consistency.
     """
-    if isinstance(result, (dict, list)):
+    if isinstance(result, (dict, list, str)):
         return result
     return str(result)
 
 
-class _DevToolsClient:
+def _offloaded(fn):
     """
-    TCP client connecting to one devtools server endpoint.
+    Expose a blocking tool body as an async tool that runs on a worker thread.
 
-    Connection strategy — fail fast, recover transparently:
-        - Connect on first tool call, fail immediately if app isn't there
-        - On connection error during request: tear down, try once to reconnect
-        - On reconnect: flush stale buffer, create fresh socket
-        - Cooldown after failure — don't hammer a dead endpoint on every call
+    FastMCP calls sync tools inline on its event loop, so one slow request
+    (a screenshot, a logs follow) would stall every other tool call. Offloaded
+    bodies let concurrent calls overlap. The signature and docstring are kept
+    via functools.wraps so FastMCP builds the same tool schema.
     """
+    from anyio import to_thread
 
-    # Errors that indicate a dead/broken connection worth retrying
-    _CONN_ERRORS = (ConnectionError, ConnectionResetError, BrokenPipeError, TimeoutError, OSError)
-
-    # After a connection failure, don't retry for this many seconds.
-    # Prevents every tool call from blocking when the app is down.
-    _COOLDOWN = 3.0
-
-    def __init__(self, host: str, port: int, timeout: float = 5.0):
-        self._host = host
-        self._port = port
-        self._timeout = timeout
-        self._sock: socket.socket | None = None
-        self._id = 0
-        self._buf = b''
-        self._last_fail: float = 0.0  # time.time() of last connection failure
-        self._lock = threading.Lock()  # Serialize requests — socket I/O isn't thread-safe
-
-    def _connect_once(self) -> None:
-        """Open a fresh TCP connection. Raises on failure."""
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(self._timeout)
-        sock.connect((self._host, self._port))
-        self._sock = sock
-        self._buf = b''  # Flush stale buffer from previous connection
-        self._last_fail = 0.0  # Clear cooldown on success
-
-    def _disconnect(self) -> None:
-        """Tear down current connection, if any."""
-        if self._sock is not None:
-            try:
-                self._sock.close()
-            except OSError:
-                pass
-            self._sock = None
-            self._buf = b''
-
-    def _fail(self) -> None:
-        """Record a connection failure for cooldown tracking."""
-        self._disconnect()
-        self._last_fail = time.time()
-
-    def _connect(self) -> None:
-        """
-        Connect if not connected. Fail fast — no retry loop.
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return await to_thread.run_sync(functools.partial(fn, *args, **kwargs))
 
-        Raises ConnectionRefusedError immediately if the app isn't listening.
-        Respects cooldown to avoid hammering a dead endpoint on every tool call.
-        """
-        if self._sock is not None:
-            return
-        if self._last_fail and (time.time() - self._last_fail) < self._COOLDOWN:
-            raise ConnectionRefusedError(
-                f'App not reachable at {self._host}:{self._port} (retrying in {self._COOLDOWN}s)'
-            )
-        try:
-            self._connect_once()
-        except self._CONN_ERRORS as err:
-            self._fail()
-            raise ConnectionRefusedError(f'App not reachable at {self._host}:{self._port}') from err
-
-    def _send_and_recv(self, msg: str) -> dict:
-        """Send a JSON-lines message and read one response line. Raises on I/O failure."""
-        self._sock.sendall(msg.encode() + b'\n')  # type: ignore[union-attr]
-
-        while b'\n' not in self._buf:
-            data = self._sock.recv(65536)  # type: ignore[union-attr]
-            if not data:
-                raise ConnectionError('Server closed connection')
-            self._buf += data
-            if len(self._buf) > _MAX_BUF:
-                raise RuntimeError('response too large')
-
-        line, self._buf = self._buf.split(b'\n', 1)
-        return json.loads(line)
-
-    def request(self, method: str, **params):
-        """
-        Send a request, return the result. Reconnects transparently on failure.
+    return wrapper
 
-        Strategy: try once -> on connection error, tear down + reconnect once.
-        Handles: app restarts, idle TCP drops, half-open sockets.
-        Fails fast when app is down.
-        """
-        with self._lock:
-            self._connect()
-            self._id += 1
-            msg = json.dumps({'id': self._id, 'method': method, 'params': params})
 
-            try:
-                resp = self._send_and_recv(msg)
-            except self._CONN_ERRORS:
-                self._disconnect()
-                try:
-                    self._connect_once()
-                    resp = self._send_and_recv(msg)
-                except self._CONN_ERRORS as e:
-                    self._fail()
-                    raise ConnectionError(f'Reconnect to {self._host}:{self._port} failed: {e}') from e
-
-            if 'error' in resp:
-                raise RuntimeError(resp['error'])
-            return resp['result']
-
-
-class _AppResolutionError(RuntimeError):
-    """Raised when app_id routing cannot resolve a live app."""
-
-
-class _AppRouter:
-    """Resolve app IDs to live endpoints using the local app registry."""
-
-    def __init__(self, *, timeout: float, host: str, port: int | None):
-        self._timeout = timeout
-        self._clients: dict[tuple[str, int], _DevToolsClient] = {}
-        self._direct_client = _DevToolsClient(host, port, timeout=timeout) if port is not None else None
-
-    def _get_client(self, host: str, port: int) -> _DevToolsClient:
-        key = (host, port)
-        client = self._clients.get(key)
-        if client is None:
-            client = _DevToolsClient(host, port, timeout=self._timeout)
-            self._clients[key] = client
-        return client
-
-    def _is_alive(self, entry: dict[str, Any]) -> bool:
-        host = entry['host']
-        port = int(entry['port'])
-        try:
-            self._get_client(host, port).request('ping')
-            return True
-        except Exception:
-            unregister_app(entry.get('registry_path'))
-            return False
-
-    def running_apps(self) -> list[dict[str, Any]]:
-        entries = sorted(
-            list_registered_apps(),
-            key=lambda item: (item.get('app_id', ''), item.get('started_at', 0.0)),
-            reverse=True,
-        )
-        seen: set[tuple[str, str, int]] = set()
-        running: list[dict[str, Any]] = []
-        for entry in entries:
-            key = (entry['app_id'], entry['host'], int(entry['port']))
-            if key in seen:
-                continue
-            if not self._is_alive(entry):
-                continue
-            seen.add(key)
-            running.append(
-                {
-                    'app_id': entry['app_id'],
-                    'host': entry['host'],
-                    'port': int(entry['port']),
-                    'pid': int(entry.get('pid', 0)),
-                    'readonly': bool(entry.get('readonly', False)),
-                }
-            )
-        return sorted(running, key=lambda item: (item['app_id'], item['port']))
-
-    def _format_running(self, running: list[dict[str, Any]]) -> str:
-        if not running:
-            return 'none'
-        return '; '.join(
-            f"{item['app_id']} ({item['host']}:{item['port']}, pid={item['pid']}, "
-            f"mode={'readonly' if item['readonly'] else 'read-write'})"
-            for item in running
-        )
+def _png_bytes(result: dict[str, Any]) -> bytes | bytearray:
+    """PNG bytes from a screenshot/winshot result — raw from binary-capable servers, else base64."""
+    data = result['data']
+    if isinstance(data, str):
+        import base64
 
-    def resolve(self, app_id: str) -> dict[str, Any]:
-        candidates = [
-            entry
-            for entry in sorted(list_registered_apps(), key=lambda item: item.get('started_at', 0.0), reverse=True)
-            if entry.get('app_id') == app_id
-        ]
+        return base64.b64decode(data)
+    return data
 
-        for entry in candidates:
-            if self._is_alive(entry):
-                return entry
 
-        running = self.running_apps()
-        raise _AppResolutionError(
-            f"Unknown app_id '{app_id}'. Running apps: {self._format_running(running)}"
-        )
+def _tool_error(exc: Exception) -> str:
+    """Return the direct tool error payload without extra wrapper prose."""
+    detail = str(exc).strip()
+    if not detail:
+        return type(exc).__name__
+    prefix = f'{type(exc).__name__}:'
+    if detail.startswith(prefix):
+        return detail
+    return f'{type(exc).__name__}: {detail}'
 
-    def request(self, *, app_id: str | None, method: str, **params):
-        if self._direct_client is not None and app_id is None:
-            return self._direct_client.request(method, **params)
 
-        if not app_id:
-            running = self.running_apps()
-            raise _AppResolutionError(
-                f'app_id is required. Running apps: {self._format_running(running)}'
-            )
+def _attach_warning(payload: Any, warning: str | None) -> Any:
+    if warning is None:
+        return payload
+    if isinstance(payload, dict):
+        out = dict(payload)
+        out['devtools_warning'] = warning
+        return out
+    return {'result': payload, 'devtools_warning': warning}
+
+
+def _normalize_logs_payload(payload: Any, *, after_id: int, before_id: int | None) -> dict[str, Any]:
+    """Normalize old/new server log response shapes into one indexed schema."""
+    if not isinstance(payload, dict):
+        return {
+            'entries': [],
+            'count': 0,
+            'first_id': None,
+            'last_id': max(0, after_id),
+            'has_older': False,
+            'has_newer': False,
+            'next_before_id': before_id,
+            'next_after_id': max(0, after_id),
+            'tip': (
+                'Use logs(before_id=next_before_id) for older context, '
+                'or logs(after_id=next_after_id, wait_seconds=5) to follow while reproducing.'
+            ),
+            'raw': payload,
+        }
 
-        resolved = self.resolve(app_id)
-        return self._get_client(resolved['host'], int(resolved['port'])).request(method, **params)
+    entries = payload.get('entries', [])
+    if not isinstance(entries, list):
+        entries = []
+
+    first_id = int(entries[0].get('id')) if entries and isinstance(entries[0], dict) and 'id' in entries[0] else None
+    last_entry_id = int(entries[-1].get('id')) if entries and isinstance(entries[-1], dict) and 'id' in entries[-1] else None
+
+    next_after_id = int(payload.get('next_after_id') or payload.get('last_id') or last_entry_id or max(0, after_id))
+    next_before_id = payload.get('next_before_id')
+    if next_before_id is None and first_id is not None:
+        next_before_id = first_id
+
+    return {
+        'entries': entries,
+        'count': int(payload.get('count', len(entries))),
+        'first_id': payload.get('first_id', first_id),
+        'last_id': payload.get('last_id', last_entry_id),
+        'has_older': bool(payload.get('has_older', False)),
+        'has_newer': bool(payload.get('has_newer', False)),
+        'next_before_id': next_before_id,
+        'next_after_id': next_after_id,
+        'tip': payload.get(
+            'tip',
+            'Use logs(before_id=next_before_id) for older context, '
+            'or logs(after_id=next_after_id, wait_seconds=5) to follow while reproducing.',
+        ),
+    }
 
 
 def main():
     # Split argv at '--' to detect wrapper mode
     argv = sys.argv[1:]
     command: list[str] | None = None
-    if '--' in argv:
+    try:
         idx = argv.index('--')
+    except ValueError:
+        pass
+    else:
         command = argv[idx + 1:]
         argv = argv[:idx]
 
@@ -274,6 +160,12 @@ def main():
         help='Direct TCP port (legacy single-app mode). If omitted, route by app_id via registry.',
     )
     parser.add_argument('--host', type=str, default='localhost', help='Direct host for --port mode (default: localhost)')
+    parser.add_argument(
+        '--socket',
+        type=str,
+        default=None,
+        help='Unix socket path. Bridge: connect directly to it instead of TCP. Wrapper: also listen on it.',
+    )
     parser.add_argument('--readonly', action='store_true', help='Disable mutation tools (run/eval)')
     parser.add_argument('--timeout', type=float, default=5.0, help='Socket timeout in seconds (default: 5)')
     args = parser.parse_args(argv)
@@ -282,22 +174,31 @@ def main():
     if command is not None:
         from python_devtools._wrap import wrap
 
-        wrap(command, port=args.port or 0, app_id=args.app_id, readonly=args.readonly)
+        wrap(command, port=args.port or 0, app_id=args.app_id, readonly=args.readonly, unix_path=args.socket)
         return
 
     # MCP bridge mode
-    router = _AppRouter(timeout=args.timeout, host=args.host, port=args.port)
-    if args.port is not None:
-        print(f'python-devtools: bridge in direct mode -> {args.host}:{args.port}', file=sys.stderr)
+    import time
+
+    from python_devtools._client import _MUTATION_METHODS, _AppResolutionError, _AppRouter
+
+    router = _AppRouter(timeout=args.timeout, host=args.host, port=args.port, unix_path=args.socket)
+    # One write for the whole startup banner — stderr is a pipe to the MCP client
+    if args.socket:
+        banner = [f'bridge in direct mode -> {args.socket}']
+    elif args.port is not None:
+        banner = [f'bridge in direct mode -> {args.host}:{args.port}']
     else:
-        print('python-devtools: bridge in app-id mode (registry-discovered endpoints)', file=sys.stderr)
-    print('python-devtools: target app must already be running externally', file=sys.stderr)
+        banner = ['bridge in app-id mode (registry-discovered endpoints)']
+    banner.append('target app must already be running externally')
     if args.app_id:
-        print(f'python-devtools: default app_id={args.app_id}', file=sys.stderr)
+        banner.append(f'default app_id={args.app_id}')
     if args.readonly:
-        print('python-devtools: readonly mode — mutation tools not registered', file=sys.stderr)
+        banner.append('readonly mode — mutation tools not registered')
     else:
-        print('python-devtools: mutations enabled (eval/exec/set/call)', file=sys.stderr)
+        banner.append('mutations enabled (eval/exec/set/call)')
+    sys.stderr.write(''.join(f'python-devtools: {line}\n' for line in banner))
+    sys.stderr.flush()
 
     # Import MCP SDK (optional dependency — only needed for the CLI)
     try:
@@ -312,19 +213,14 @@ def main():
 
     mcp = FastMCP('python-devtools')
 
+    default_app_id = args.app_id
+    route = router.request
+
     def _request(method: str, *, app_id: str | None = None, **params):
-        target_app_id = app_id or args.app_id
-        return router.request(app_id=target_app_id, method=method, **params)
-
-    def _tool_error(exc: Exception) -> str:
-        """Return the direct tool error payload without extra wrapper prose."""
-        detail = str(exc).strip()
-        if not detail:
-            return type(exc).__name__
-        prefix = f'{type(exc).__name__}:'
-        if detail.startswith(prefix):
-            return detail
-        return f'{type(exc).__name__}: {detail}'
+        return route(app_id=app_id or default_app_id, method=method, **params)
+
+    def _request_many(calls: list[tuple[str, dict[str, Any]]], *, app_id: str | None = None):
+        return router.request_many(app_id=app_id or default_app_id, calls=calls)
 
     def _resolve_target(app_id: str | None) -> dict[str, Any] | None:
         target_app_id = app_id or args.app_id
@@ -368,63 +264,24 @@ def main():
             )
         return None
 
-    def _attach_warning(payload: Any, warning: str | None) -> Any:
-        if warning is None:
-            return payload
-        if isinstance(payload, dict):
-            out = dict(payload)
-            out['devtools_warning'] = warning
-            return out
-        return {'result': payload, 'devtools_warning': warning}
-
-    def _normalize_logs_payload(payload: Any, *, after_id: int, before_id: int | None) -> dict[str, Any]:
-        """Normalize old/new server log response shapes into one indexed schema."""
-        if not isinstance(payload, dict):
-            return {
-                'entries': [],
-                'count': 0,
-                'first_id': None,
-                'last_id': max(0, after_id),
-                'has_older': False,
-                'has_newer': False,
-                'next_before_id': before_id,
-                'next_after_id': max(0, after_id),
-                'tip': (
-                    'Use logs(before_id=next_before_id) for older context, '
-                    'or logs(after_id=next_after_id, wait_seconds=5) to follow while reproducing.'
-                ),
-                'raw': payload,
-            }
-
-        entries = payload.get('entries', [])
-        if not isinstance(entries, list):
-            entries = []
-
-        first_id = int(entries[0].get('id')) if entries and isinstance(entries[0], dict) and 'id' in entries[0] else None
-        last_entry_id = int(entries[-1].get('id')) if entries and isinstance(entries[-1], dict) and 'id' in entries[-1] else None
-
-        next_after_id = int(payload.get('next_after_id') or payload.get('last_id') or last_entry_id or max(0, after_id))
-        next_before_id = payload.get('next_before_id')
-        if next_before_id is None and first_id is not None:
-            next_before_id = first_id
+    # Shared tool bodies — each tool keeps its own typed signature and
+    # docstring (FastMCP builds the schema from them) and forwards here
+    def _forward(method: str, app_id: str | None, **params) -> Any:
+        try:
+            return _fmt(_request(method, app_id=app_id, **params))
+        except Exception as exc:
+            return _tool_error(exc)
 
-        return {
-            'entries': entries,
-            'count': int(payload.get('count', len(entries))),
-            'first_id': payload.get('first_id', first_id),
-            'last_id': payload.get('last_id', last_entry_id),
-            'has_older': bool(payload.get('has_older', False)),
-            'has_newer': bool(payload.get('has_newer', False)),
-            'next_before_id': next_before_id,
-            'next_after_id': next_after_id,
-            'tip': payload.get(
-                'tip',
-                'Use logs(before_id=next_before_id) for older context, '
-                'or logs(after_id=next_after_id, wait_seconds=5) to follow while reproducing.',
-            ),
-        }
+    def _mutate(method: str, app_id: str | None, **params) -> Any:
+        try:
+            target_before = _resolve_target(app_id)
+            result = _fmt(_request(method, app_id=app_id, **params))
+            return _attach_warning(result, _post_mutation_warning(app_id=app_id, target_before=target_before))
+        except Exception as exc:
+            return _tool_error(exc)
 
     @mcp.tool()
+    @_offloaded
     def running_apps() -> Any:
         """List reachable running devtools apps discovered via registry (stale entries are pruned)."""
         return _fmt(router.running_apps())
@@ -433,6 +290,7 @@ def main():
     if not args.readonly:
 
         @mcp.tool()
+        @_offloaded
         def run(
             code: str,
             app_id: str | None = None,
@@ -445,95 +303,86 @@ def main():
             Lossless by default: no truncation unless limits are explicitly set.
             Set max_result_chars/max_result_lines > 0 to compact large text output.
             """
-            try:
-                target_before = _resolve_target(app_id)
-                result = _fmt(
-                    _request(
-                        'eval',
-                        app_id=app_id,
-                        code=code,
-                        max_result_chars=max(0, int(max_result_chars)),
-                        max_result_lines=max(0, int(max_result_lines)),
-                    )
-                )
-                return _attach_warning(result, _post_mutation_warning(app_id=app_id, target_before=target_before))
-            except Exception as exc:
-                return _tool_error(exc)
+            return _mutate(
+                'eval',
+                app_id,
+                code=code,
+                max_result_chars=max(0, int(max_result_chars)),
+                max_result_lines=max(0, int(max_result_lines)),
+            )
 
         @mcp.tool()
+        @_offloaded
         def call(path: str, args: list | None = None, kwargs: dict | None = None, app_id: str | None = None) -> Any:
             """Call a callable at a dotted path in an already-running app."""
-            try:
-                target_before = _resolve_target(app_id)
-                result = _fmt(_request('call', app_id=app_id, path=path, args=args, kwargs=kwargs))
-                return _attach_warning(result, _post_mutation_warning(app_id=app_id, target_before=target_before))
-            except Exception as exc:
-                return _tool_error(exc)
+            return _mutate('call', app_id, path=path, args=args, kwargs=kwargs)
 
         @mcp.tool()
+        @_offloaded
         def set_value(path: str, value_expr: str, app_id: str | None = None) -> Any:
             """Set an attribute or item at a dotted path in an already-running app."""
-            try:
-                target_before = _resolve_target(app_id)
-                result = _fmt(_request('set', app_id=app_id, path=path, value_expr=value_expr))
-                return _attach_warning(result, _post_mutation_warning(app_id=app_id, target_before=target_before))
-            except Exception as exc:
-                return _tool_error(exc)
+            return _mutate('set', app_id, path=path, value_expr=value_expr)
 
         @mcp.tool()
+        @_offloaded
         def winshot(code: str, app_id: str | None = None):
             """Render UI code in an isolated offscreen window in an already-running target app."""
-            import base64
-
             try:
-                result = _request('winshot', app_id=app_id, code=code)
-                png_bytes = base64.b64decode(result['data'])
-                return Image(data=png_bytes, format='png')
+                result = _request(
+                    'winshot',
+                    app_id=app_id,
+                    code=code,
+                    binary=True,
+                    timeout_override=max(args.timeout, _CAPTURE_TIMEOUT),
+                )
+                return Image(data=_png_bytes(result), format='png')
             except Exception as exc:
                 return _tool_error(exc)
 
     # Read-only tools: always registered
     @mcp.tool()
+    @_offloaded
     def inspect(path: str, max_depth: int = 2, max_items: int = 50, app_id: str | None = None) -> Any:
         """Inspect an object at a dotted path (pair with logs() to correlate state with events)."""
+        return _forward('inspect', app_id, path=path, max_depth=max_depth, max_items=max_items)
+
+    @mcp.tool()
+    @_offloaded
+    def batch_inspect(paths: list[str], max_depth: int = 2, max_items: int = 50, app_id: str | None = None) -> Any:
+        """Inspect several dotted paths in one round trip. Returns one {path, result} or {path, error} per path."""
         try:
-            return _fmt(_request('inspect', app_id=app_id, path=path, max_depth=max_depth, max_items=max_items))
+            params = {'max_depth': max_depth, 'max_items': max_items}
+            slots = _request_many([('inspect', {'path': path, **params}) for path in paths], app_id=app_id)
+            return [{'path': path, **slot} for path, slot in zip(paths, slots, strict=True)]
         except Exception as exc:
             return _tool_error(exc)
 
     @mcp.tool()
+    @_offloaded
     def list_path(path: str, max_items: int = 50, app_id: str | None = None) -> Any:
         """List contents at a dotted path in an already-running app — attrs, keys, or items."""
-        try:
-            return _fmt(_request('list', app_id=app_id, path=path, max_items=max_items))
-        except Exception as exc:
-            return _tool_error(exc)
+        return _forward('list', app_id, path=path, max_items=max_items)
 
     @mcp.tool()
+    @_offloaded
     def repr_obj(path: str, app_id: str | None = None) -> Any:
         """Quick type + repr of an object at a dotted path in an already-running app."""
-        try:
-            return _fmt(_request('repr', app_id=app_id, path=path))
-        except Exception as exc:
-            return _tool_error(exc)
+        return _forward('repr', app_id, path=path)
 
     @mcp.tool()
+    @_offloaded
     def source(path: str, app_id: str | None = None) -> Any:
         """Get source code of a function, class, or method from an already-running app."""
-        try:
-            return _fmt(_request('source', app_id=app_id, path=path))
-        except Exception as exc:
-            return _tool_error(exc)
+        return _forward('source', app_id, path=path)
 
     @mcp.tool()
+    @_offloaded
     def state(app_id: str | None = None) -> Any:
         """List all registered namespaces and their types for one already-running app."""
-        try:
-            return _fmt(_request('state', app_id=app_id))
-        except Exception as exc:
-            return _tool_error(exc)
+        return _forward('state', app_id)
 
     @mcp.tool()
+    @_offloaded
     def logs(
         after_id: int = 0,
         before_id: int | None = None,
@@ -561,6 +410,7 @@ def main():
             deadline = time.monotonic() + max_wait
             while True:
                 remaining = max(0.0, deadline - time.monotonic())
+                wait = remaining if (before_id is None and max_wait > 0.0) else 0.0
                 payload = _request(
                     'logs',
                     app_id=app_id,
@@ -571,7 +421,9 @@ def main():
                     limit=limit,
                     level=level,
                     logger=logger,
-                    wait_seconds=remaining if (before_id is None and max_wait > 0.0) else 0.0,
+                    wait_seconds=wait,
+                    # The server holds the reply for up to `wait` — don't time out first
+                    timeout_override=args.timeout + wait if wait > 0.0 else None,
                 )
                 normalized = _normalize_logs_payload(payload, after_id=cursor, before_id=before_id)
 
@@ -588,26 +440,57 @@ def main():
             return _tool_error(exc)
 
     @mcp.tool()
+    @_offloaded
+    def batch(calls: list[dict[str, Any]], app_id: str | None = None) -> Any:
+        """
+        Run several devtools calls in one round trip: [{"method": ..., "params": {...}}, ...].
+
+        Methods use wire names: repr, list, inspect, source, state, logs, ping,
+        plus eval/call/set when mutations are enabled. Returns one {result} or
+        {error} per call, in order.
+        """
+        try:
+            pairs: list[tuple[str, dict[str, Any]]] = []
+            for entry in calls:
+                method = str(entry.get('method', ''))
+                if args.readonly and method in _MUTATION_METHODS:
+                    raise PermissionError(f'{method!r} is disabled — bridge is in readonly mode')
+                pairs.append((method, dict(entry.get('params') or {})))
+
+            mutates = any(method in _MUTATION_METHODS for method, _ in pairs)
+            target_before = _resolve_target(app_id) if mutates else None
+            result = _fmt(_request_many(pairs, app_id=app_id))
+            if not mutates:
+                return result
+            return _attach_warning(result, _post_mutation_warning(app_id=app_id, target_before=target_before))
+        except Exception as exc:
+            return _tool_error(exc)
+
+    @mcp.tool()
+    @_offloaded
     def screenshot(app_id: str | None = None):
         """Capture a screenshot of an already-running target app's GUI."""
-        import base64
-
         try:
-            result = _request('screenshot', app_id=app_id)
-            png_bytes = base64.b64decode(result['data'])
-            return Image(data=png_bytes, format='png')
+            result = _request(
+                'screenshot',
+                app_id=app_id,
+                binary=True,
+                timeout_override=max(args.timeout, _CAPTURE_TIMEOUT),
+            )
+            return Image(data=_png_bytes(result), format='png')
         except Exception as exc:
             return _tool_error(exc)
 
     @mcp.tool()
+    @_offloaded
     def ping(app_id: str | None = None) -> Any:
         """Ping one already-running app, or list running apps when app_id is omitted."""
-        try:
-            if app_id is None and args.app_id is None:
+        if app_id is None and args.app_id is None:
+            try:
                 return _fmt(router.running_apps())
-            return _fmt(_request('ping', app_id=app_id))
-        except Exception as exc:
-            return _tool_error(exc)
+            except Exception as exc:
+                return _tool_error(exc)
+        return _forward('ping', app_id)
 
     # Run as stdio MCP server (Claude Code connects here)
     mcp.run()
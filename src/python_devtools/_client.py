@@ -0,0 +1,768 @@
+"""
+MCP bridge client side — connections to devtools servers and app_id routing.
+
+Imported by the CLI in bridge mode only, so wrapper mode (`python-devtools --
+cmd`) starts without loading sockets, threads or the registry.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import json
+import os
+import random
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from python_devtools._registry import list_registered_apps, unregister_app
+
+# orjson is an optional speedup for the bridge's wire codec (`pip install
+# python-devtools[fast]`); stdlib json is the fallback. Both encode to bytes,
+# and _loads takes a memoryview — orjson parses it in place, no copy.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# No default= fallback on either codec: params come from MCP tool arguments and
+# are plain JSON already, so anything else is a bug to surface, not stringify.
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+
+    _encoder = json.JSONEncoder(separators=(',', ':'))
+
+    def _dumps(obj: Any) -> bytes:
+        return _encoder.encode(obj).encode()
+
+    def _loads(data: memoryview) -> Any:
+        return json.loads(bytes(data))
+
+# 10 MB — guard against runaway responses filling memory
+_MAX_BUF = 10 * 1024 * 1024
+# Base receive buffer capacity — the largest single recv for a typical
+# response. Doubles on demand for large responses, relaxes back afterwards.
+_RECV_BUF_SIZE = 1 << 18
+# Grow before a recv that would have less spare room than this, so a large
+# response never trickles in through a nearly full buffer
+_RECV_MIN_WINDOW = 1 << 16
+# Kernel socket buffer size requested for bridge connections (loopback only)
+_SOCK_BUF_SIZE = 4 * 1024 * 1024
+# Methods that mutate app state — they invalidate cached read results
+_MUTATION_METHODS = frozenset({'eval', 'call', 'set', 'winshot'})
+# A batch may carry mutations, so it invalidates cached reads as well
+_INVALIDATING_METHODS = _MUTATION_METHODS | {'batch'}
+# Idempotent reads whose results may be reused, with how long (seconds).
+# Agents often re-ask the same path right after a step. Source gets the same
+# short window: the app may hot-reload a module edited on disk, which the
+# bridge never sees.
+_CACHE_TTLS: dict[str, float] = {
+    'repr': 0.5,
+    'state': 0.5,
+    'list': 0.5,
+    'inspect': 0.5,
+    'source': 0.5,
+}
+_CACHE_MAX_ENTRIES = 256
+# Registry liveness probes: connect timeout, and most probes run at once
+_PROBE_TIMEOUT = 0.2
+_PROBE_WORKERS = 16
+# Keepalive frame — the server answers a NUL-byte line with a 0x01 line, no JSON
+_KEEPALIVE = b'\x00\n'
+# How often (seconds) the router checks pooled connections for half-open sockets
+_KEEPALIVE_INTERVAL = 30.0
+
+
+# Pre-encoded '{"method":...,"params":' heads, one per method name.
+# Methods come from the fixed tool set, so this stays tiny.
+_ENVELOPE_HEADS: dict[str, bytes] = {}
+
+
+def _encode_request(req_id: int, method: str, params: dict[str, Any]) -> bytes:
+    """Build one newline-terminated request frame; only params and id are serialized per call."""
+    head = _ENVELOPE_HEADS.get(method)
+    if head is None:
+        head = _ENVELOPE_HEADS[method] = b'{"method":%s,"params":' % _dumps(method)
+    return b'%s%s,"id":%d}\n' % (head, _dumps(params), req_id)
+
+
+class _Conn:
+    """
+    One socket to a devtools server plus its receive buffer.
+
+    Used by one request at a time — the client hands it out from its idle
+    pool and takes it back once the response has been read in full.
+    """
+
+    __slots__ = ('buf', 'end', 'scan', 'sock')
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.buf = bytearray(_RECV_BUF_SIZE)
+        self.end = 0  # Bytes of buf holding received data
+        self.scan = 0  # Offset in buf already searched for a newline
+
+    def close(self) -> None:
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+    def send_and_recv(self, msg: bytes) -> dict:
+        """Send one request frame and read one response line. Raises on I/O failure."""
+        self.sock.sendall(msg)
+        idx = self._read_line()
+        # Parse the line where it sits instead of slicing a copy out first
+        with memoryview(self.buf) as view:
+            resp = _loads(view[:idx])
+        self._consume(idx)
+        result = resp.get('result')
+        if isinstance(result, dict) and result.get('encoding') == 'binary':
+            result['data'] = self._recv_exact(int(result['size']))
+        # Relax back to the base capacity once a large response is consumed,
+        # so one screenshot doesn't pin megabytes per idle connection
+        if len(self.buf) > _RECV_BUF_SIZE and self.end <= _RECV_BUF_SIZE:
+            del self.buf[_RECV_BUF_SIZE:]
+        return resp
+
+    def keepalive(self) -> None:
+        """
+        Send the one-byte keepalive frame and wait for any reply line.
+
+        Servers that predate it answer with a JSON parse error instead — still
+        a reply, so still alive. Raises on I/O failure.
+        """
+        self.sock.sendall(_KEEPALIVE)
+        self._consume(self._read_line())
+
+    def _read_line(self) -> int:
+        """Receive until buf holds a full line; return the newline's index."""
+        # Receive straight into the spare capacity of one buffer: no per-chunk
+        # bytes objects, and each recv can take everything the kernel has
+        # queued. The newline scan resumes where the previous pass stopped.
+        # Cursors and bound methods are kept in locals inside the loop.
+        buf = self.buf
+        find = buf.find
+        recv_into = self.sock.recv_into
+        end = self.end
+        scan = self.scan
+        while (idx := find(b'\n', scan, end)) < 0:
+            scan = end
+            if len(buf) - end < _RECV_MIN_WINDOW and len(buf) < _MAX_BUF:
+                # Double — O(log n) resizes per response, capped so an oversized
+                # response never allocates past the limit
+                buf.extend(bytes(min(len(buf), _MAX_BUF - len(buf))))
+            if end == len(buf):
+                raise RuntimeError(f'response too large (over {_MAX_BUF} bytes)')
+            n = recv_into(memoryview(buf)[end:])
+            if not n:
+                raise ConnectionError('Server closed connection')
+            end += n
+        self.end = end
+        return idx
+
+    def _consume(self, idx: int) -> None:
+        """Drop the line ending at idx from buf."""
+        # Shift any bytes past the newline to the front (same-length slice
+        # assignment, so capacity is kept). Usually there are none. On any
+        # error the connection is dropped, so cursors are only reset here.
+        tail = self.end - idx - 1
+        if tail:
+            self.buf[:tail] = self.buf[idx + 1:self.end]
+        self.end = tail
+        self.scan = 0
+
+    def _recv_exact(self, size: int) -> bytearray:
+        """
+        Read the `size` raw payload bytes that follow a binary result's header line.
+
+        Received straight into a right-sized bytearray, which is returned as
+        is — no bytes() copy of a multi-MB PNG on the way to the MCP Image.
+        """
+        if size > _MAX_BUF:
+            raise RuntimeError(f'response too large (over {_MAX_BUF} bytes)')
+        out = bytearray(size)
+        have = min(self.end, size)
+        out[:have] = self.buf[:have]  # Part may already sit in the line buffer
+        rest = self.end - have
+        if rest:
+            self.buf[:rest] = self.buf[have:self.end]
+        self.end = rest
+        view = memoryview(out)
+        while have < size:
+            n = self.sock.recv_into(view[have:])
+            if not n:
+                raise ConnectionError('Server closed connection')
+            have += n
+        return out
+
+
+class _DevToolsClient:
+    """
+    Client for one devtools server endpoint — TCP, or a Unix socket if unix_path is set.
+
+    Connection strategy — fail fast, recover transparently:
+        - Connect on first tool call, fail immediately if app isn't there
+        - On connection error during request: drop that socket, try once on a fresh one
+        - Cooldown after failure — don't hammer a dead endpoint on every call.
+          It starts short and doubles per consecutive failure, so an app that
+          is just starting up is picked up quickly, and a dead one costs little.
+          ping always tries for real — it's what liveness checks rely on
+
+    Concurrency:
+        Tools run on worker threads. Each request borrows a connection from a
+        small idle pool (most recently used first) or opens a new one, so
+        concurrent calls run side by side — the server serves each connection
+        on its own thread. At most _POOL_SIZE are in flight; _lock only guards
+        the pool and cache clears, never socket I/O.
+
+    Read cache:
+        Results of idempotent reads (repr/state/source/list/inspect) are reused
+        for a per-method TTL (_CACHE_TTLS). Any mutation method or new
+        connection clears it.
+    """
+
+    # Errors that indicate a dead/broken connection worth retrying
+    _CONN_ERRORS = (ConnectionError, ConnectionResetError, BrokenPipeError, TimeoutError, OSError)
+
+    # After a connection failure, don't retry for a while. Prevents every tool
+    # call from blocking when the app is down. Backs off exponentially from
+    # _COOLDOWN_MIN to _COOLDOWN over consecutive failures.
+    _COOLDOWN_MIN = 0.1
+    _COOLDOWN = 3.0
+
+    # Most requests in flight (and connections open) per endpoint. Further
+    # calls wait for a slot rather than piling threads onto the app.
+    _POOL_SIZE = 4
+
+    def __init__(self, host: str, port: int | None, timeout: float = 5.0, *, unix_path: str | None = None):
+        self._host = host
+        self._port = port
+        self._unix_path = unix_path
+        self._endpoint = unix_path or f'{host}:{port}'  # For error messages
+        self._timeout = timeout
+        self._idle: list[_Conn] = []  # Connected, not in use — reused LIFO
+        self._ids = itertools.count(1)  # next() is atomic — no lock needed for ids
+        self._retry_at: float = 0.0  # time.monotonic() before which new connects fail fast
+        self._cooldown: float = 0.0  # Current backoff window, 0 when healthy
+        self._cache: dict[tuple, tuple[float, Any]] = {}  # key -> (monotonic ts, result)
+        # Bumped by every invalidation. A read only caches its result if this
+        # hasn't moved since it was sent — else it may predate a mutation.
+        self._cache_gen = 0
+        self._lock = threading.Lock()  # Guards _idle and cache clears — held briefly
+        self._slots = threading.BoundedSemaphore(self._POOL_SIZE)
+
+    def _connect_once(self) -> _Conn:
+        """Open a fresh connection. Raises on failure."""
+        if self._unix_path:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.settimeout(self._timeout)
+                sock.connect(self._unix_path)
+            except OSError:
+                sock.close()
+                if self._port is None:
+                    raise
+                # Socket file gone or refused — the app's TCP listener may still be up
+            except BaseException:
+                sock.close()
+                raise
+            else:
+                return self._connected(sock)
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            # One small request per tool call — don't let Nagle hold it back
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Let the kernel notice dead peers on idle connections
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Room for a whole multi-MB response (screenshots, deep inspects) in the
+            # kernel, so the app doesn't stall on the window while we parse.
+            # Best effort — kernels may cap or refuse it.
+            for opt in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET, opt, _SOCK_BUF_SIZE)
+                except OSError:
+                    pass
+            sock.settimeout(self._timeout)
+            sock.connect((self._host, self._port))
+            # Linux: ack replies right away instead of waiting for delayed-ACK.
+            # The kernel may drop back to delayed ACKs later — this is best effort.
+            if hasattr(socket, 'TCP_QUICKACK'):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except BaseException:
+            sock.close()
+            raise
+        return self._connected(sock)
+
+    def _invalidate(self) -> None:
+        """Drop cached reads, and keep in-flight ones from being stored."""
+        with self._lock:
+            self._cache_gen += 1
+            self._cache.clear()
+
+    def _connected(self, sock: socket.socket) -> _Conn:
+        self._invalidate()  # Fresh connection may be a restarted app
+        self._retry_at = 0.0  # Clear cooldown on success
+        self._cooldown = 0.0
+        return _Conn(sock)
+
+    def _fail(self) -> None:
+        """Record a connection failure for cooldown tracking."""
+        self._cooldown = min(self._cooldown * 2, self._COOLDOWN) if self._cooldown else self._COOLDOWN_MIN
+        # ±20% jitter so several bridges watching one app don't retry in lockstep
+        self._retry_at = time.monotonic() + self._cooldown * random.uniform(0.8, 1.2)
+
+    def _check_cooldown(self) -> None:
+        """Raise right away while a recent connection failure's cooldown is running."""
+        remaining = self._retry_at - time.monotonic()
+        if remaining > 0:
+            raise ConnectionRefusedError(
+                f'App not reachable at {self._endpoint} (retrying in {remaining:.1f}s)'
+            )
+
+    def _connect(self, *, bypass_cooldown: bool = False) -> _Conn:
+        """
+        Open a new connection. Fail fast — no retry loop.
+
+        Raises ConnectionRefusedError immediately if the app isn't listening.
+        Respects cooldown to avoid hammering a dead endpoint on every tool call,
+        unless bypass_cooldown (liveness pings must see the real state).
+        """
+        if not bypass_cooldown:
+            self._check_cooldown()
+        try:
+            return self._connect_once()
+        except self._CONN_ERRORS as err:
+            self._fail()
+            raise ConnectionRefusedError(f'App not reachable at {self._endpoint}') from err
+
+    def _roundtrip(self, method: str, params: dict[str, Any], timeout: float | None) -> dict:
+        """
+        One request/response exchange on a pooled connection. Caller holds a _slots slot.
+
+        timeout, if given, replaces the socket timeout for this exchange only.
+        """
+        msg = _encode_request(next(self._ids), method, params)  # Before borrowing — may raise TypeError
+        with self._lock:
+            if method in _INVALIDATING_METHODS:
+                self._cache_gen += 1
+                self._cache.clear()
+            conn = self._idle.pop() if self._idle else None
+
+        if conn is None:
+            conn = self._connect(bypass_cooldown=method == 'ping')
+        try:
+            resp = self._exchange(conn, msg, timeout)
+        except self._CONN_ERRORS as err:
+            conn.close()
+            if isinstance(err, ConnectionError):
+                # Reset/closed by the peer — the app likely restarted, so the other
+                # idle sockets are dead too. Drop them rather than fail on each in turn.
+                # (A timeout says nothing about the siblings; they're kept.)
+                self.close()
+            try:
+                conn = self._connect_once()
+                resp = self._exchange(conn, msg, timeout)
+            except self._CONN_ERRORS as e:
+                conn.close()
+                self._fail()
+                raise ConnectionError(f'Reconnect to {self._endpoint} failed: {e}') from e
+            except BaseException:
+                conn.close()
+                raise
+        except BaseException:
+            conn.close()  # Mid-response failure — the stream can't be trusted any more
+            raise
+        with self._lock:
+            self._idle.append(conn)
+        return resp
+
+    def _exchange(self, conn: _Conn, msg: bytes, timeout: float | None) -> dict:
+        if timeout is None:
+            return conn.send_and_recv(msg)
+        conn.sock.settimeout(timeout)
+        try:
+            return conn.send_and_recv(msg)
+        finally:
+            conn.sock.settimeout(self._timeout)
+
+    def request(self, method: str, *, timeout_override: float | None = None, **params):
+        """
+        Send a request, return the result. Reconnects transparently on failure.
+
+        timeout_override replaces the socket timeout for this call — for
+        requests expected to outlast it (screen captures, log follows).
+
+        Strategy: try once -> on connection error, drop the socket + retry once on a new one.
+        Handles: app restarts, idle TCP drops, half-open sockets.
+        Fails fast when app is down.
+        """
+        key = None
+        ttl = _CACHE_TTLS.get(method)
+        if ttl is not None:
+            key = (method, tuple(sorted(params.items())))
+            try:
+                hit = self._cache.get(key)  # Single dict op — atomic under the GIL
+            except TypeError:  # Unhashable params — just don't cache
+                key = hit = None
+            if hit is not None and time.monotonic() - hit[0] < ttl:
+                return hit[1]
+        gen = self._cache_gen
+
+        with self._slots:
+            try:
+                resp = self._roundtrip(method, params, timeout_override)
+            finally:
+                if method in _INVALIDATING_METHODS:
+                    # Again once done: reads sent meanwhile on other connections
+                    # may have been served before this mutation landed
+                    self._invalidate()
+
+        if 'error' in resp:
+            raise RuntimeError(resp['error'])
+        result = resp['result']
+        if key is not None:
+            with self._lock:
+                if self._cache_gen == gen:
+                    if len(self._cache) >= _CACHE_MAX_ENTRIES:
+                        self._cache.clear()
+                    self._cache[key] = (time.monotonic(), result)
+        return result
+
+    def ping_fast(self, timeout: float = _PROBE_TIMEOUT) -> bool:
+        """
+        Liveness over the keepalive frame — no JSON encode or parse either way.
+
+        Reuses a pooled connection when there is one (falling back to a fresh
+        one if that turns out stale). Ignores the cooldown. Never raises.
+        With every slot taken by requests in flight (log follows, captures)
+        the app counts as alive rather than waiting on one to finish.
+        """
+        if not self._slots.acquire(timeout=timeout):
+            return True
+        try:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            for pooled in ((conn, None) if conn is not None else (None,)):
+                conn = None
+                try:
+                    conn = pooled or self._connect(bypass_cooldown=True)
+                    conn.sock.settimeout(timeout)
+                    conn.keepalive()
+                    conn.sock.settimeout(self._timeout)
+                except Exception:
+                    if conn is not None:
+                        conn.close()
+                    continue
+                with self._lock:
+                    self._idle.append(conn)
+                return True
+            return False
+        finally:
+            self._slots.release()
+
+    def sweep(self, timeout: float = _PROBE_TIMEOUT) -> bool | None:
+        """
+        Keepalive every idle connection, closing the ones that don't answer.
+
+        Returns whether any survived, or None if there were none to check.
+        Connections in use are left alone. Never raises.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+        if not idle:
+            return None
+        live: list[_Conn] = []
+        for conn in idle:
+            try:
+                conn.sock.settimeout(timeout)
+                conn.keepalive()
+                conn.sock.settimeout(self._timeout)
+            except Exception:
+                conn.close()
+            else:
+                live.append(conn)
+        with self._lock:
+            # Requests may have opened fresh connections meanwhile — keep the
+            # pool bounded. Swept ones go back at the cold end of the LIFO.
+            room = max(0, self._POOL_SIZE - len(self._idle))
+            extra = live[:-room] if room else live
+            self._idle[:0] = live[len(extra):]
+        for conn in extra:
+            conn.close()
+        return bool(live)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def request_many(self, calls: list[tuple[str, dict[str, Any]]]) -> list[dict[str, Any]]:
+        """
+        Run several calls in one round trip via the server's batch method.
+
+        Returns one {result} or {error} slot per call, in order. Servers that
+        predate batch get the calls one at a time instead.
+        """
+        try:
+            return self.request('batch', calls=[{'method': m, 'params': p} for m, p in calls])
+        except RuntimeError as e:
+            if "Unknown method: 'batch'" not in str(e):
+                raise
+
+        out: list[dict[str, Any]] = []
+        for method, params in calls:
+            try:
+                out.append({'result': self.request(method, **params)})
+            except RuntimeError as e:
+                out.append({'error': str(e)})
+        return out
+
+
+def _probe(host: str, port: int, timeout: float = _PROBE_TIMEOUT) -> bool | None:
+    """
+    Cheap liveness check — is anything accepting TCP connections at host:port?
+
+    The kernel completes the handshake from the listen backlog, so a busy app
+    (GIL held, long frame) still connects. False only for a refused connect;
+    None when there was no answer either way (timeout, unresolvable host).
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect((host, port))
+    except ConnectionRefusedError:
+        return False
+    except OSError:
+        return None
+    finally:
+        sock.close()
+    return True
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether process pid still exists. True when it can't be told (no pid, Windows)."""
+    if pid <= 0 or os.name == 'nt':  # os.kill(pid, 0) would terminate it on Windows
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:  # EPERM — exists, someone else's
+        return True
+    return True
+
+
+@functools.lru_cache(maxsize=8)
+def _format_running_digest(running: tuple[tuple[str, str, int, int, bool], ...]) -> str:
+    """Render (app_id, host, port, pid, readonly) rows — the running set rarely changes between errors."""
+    if not running:
+        return 'none'
+    return '; '.join(
+        f"{app_id} ({host}:{port}, pid={pid}, mode={'readonly' if readonly else 'read-write'})"
+        for app_id, host, port, pid, readonly in running
+    )
+
+
+class _AppResolutionError(RuntimeError):
+    """Raised when app_id routing cannot resolve a live app."""
+
+
+class _AppRouter:
+    """Resolve app IDs to live endpoints using the local app registry."""
+
+    # Registry listings are reused this long (seconds), so one tool call that
+    # resolves, then lists running apps for an error, reads the directory once
+    _REG_TTL = 0.2
+
+    def __init__(self, *, timeout: float, host: str, port: int | None, unix_path: str | None = None):
+        self._timeout = timeout
+        # One client (and so one connection pool + read cache) per endpoint,
+        # shared by direct mode and app_id routing
+        self._clients: dict[tuple[str, int | None, str | None], _DevToolsClient] = {}
+        self._direct_client = self._get_client(host, port, unix_path) if port is not None or unix_path else None
+        self._reg_cache: tuple[float, list[dict[str, Any]]] | None = None  # (monotonic ts, entries)
+        # Started by the first request that leaves a pooled connection behind
+        self._keepalive_thread: threading.Thread | None = None
+        self._keepalive_lock = threading.Lock()
+
+    def _start_keepalive(self) -> None:
+        """Start the keepalive loop once — there is now a pooled connection to look after."""
+        if self._keepalive_thread is not None:
+            return
+        with self._keepalive_lock:
+            if self._keepalive_thread is None:
+                self._keepalive_thread = threading.Thread(target=self._keepalive, daemon=True, name='devtools-keepalive')
+                self._keepalive_thread.start()
+
+    def _keepalive(self) -> None:
+        """
+        Background loop: find half-open pooled connections before a tool call does.
+
+        Every _KEEPALIVE_INTERVAL, each client's idle connections get a
+        keepalive frame; dead ones are closed. A routed client with nothing
+        left alive is dropped (recreated on next use). _clients is only
+        changed through single dict ops (setdefault/pop), atomic under the GIL.
+        """
+        while True:
+            time.sleep(_KEEPALIVE_INTERVAL)
+            for key, client in list(self._clients.items()):
+                if client.sweep() is False and client is not self._direct_client:
+                    self._clients.pop(key, None)
+                    client.close()
+
+    def _registered(self) -> list[dict[str, Any]]:
+        """list_registered_apps(), reused for _REG_TTL. Dropped whenever an entry is pruned."""
+        cached = self._reg_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self._REG_TTL:
+            return cached[1]
+        entries = list_registered_apps()
+        self._reg_cache = (now, entries)
+        return entries
+
+    def _get_client(self, host: str, port: int | None, unix_path: str | None = None) -> _DevToolsClient:
+        key = (host, port, unix_path)
+        client = self._clients.get(key)
+        if client is None:
+            client = self._clients.setdefault(key, _DevToolsClient(host, port, timeout=self._timeout, unix_path=unix_path))
+        return client
+
+    def _is_alive(self, entry: dict[str, Any]) -> bool:
+        """
+        Whether a registry entry's endpoint accepts connections. Prunes the entry if it's gone.
+
+        A keepalive frame on a warm connection, else a TCP connect probe — not
+        a ping RPC, so dead entries cost one refused connect instead of a
+        request timeout.
+        """
+        return self._settle(entry, self._check(*self._endpoint_of(entry)))
+
+    def _settle(self, entry: dict[str, Any], checked: bool | None) -> bool:
+        """
+        Turn a _check result into alive/dead, pruning the entry only on proof.
+
+        A refused connect is proof; so is an unanswered check (None) from an
+        app whose process has exited. An unanswered check from a live process
+        is a busy app — counted alive, never pruned. The entry's socket file
+        is left to its server.
+        """
+        alive = _pid_alive(int(entry.get('pid', 0))) if checked is None else checked
+        if not alive:
+            unregister_app(entry.get('registry_path'))
+            self._reg_cache = None
+        return alive
+
+    @staticmethod
+    def _endpoint_of(entry: dict[str, Any]) -> tuple[str, int, str | None]:
+        """Client key for a registry entry — its Unix socket is preferred when it advertises one."""
+        return entry['host'], int(entry['port']), entry.get('unix_path')
+
+    def _check(self, host: str, port: int, unix_path: str | None = None) -> bool | None:
+        """
+        Keepalive on a warm pooled connection if there is one, else a connect probe.
+
+        A keepalive the app was too busy to answer in time falls through to the
+        probe, which the kernel answers. Returns _probe's True/False/None.
+        """
+        client = self._clients.get((host, port, unix_path))
+        if client is not None and client._idle and client.ping_fast():
+            return True
+        return _probe(host, port)
+
+    def _probe_all(self, entries: list[dict[str, Any]]) -> dict[tuple[str, int, str | None], bool | None]:
+        """Check each distinct endpoint once, concurrently — N stale entries cost ~one probe timeout."""
+        endpoints = list({self._endpoint_of(entry) for entry in entries})
+        if len(endpoints) <= 1:
+            return {endpoint: self._check(*endpoint) for endpoint in endpoints}
+        with ThreadPoolExecutor(max_workers=min(_PROBE_WORKERS, len(endpoints))) as pool:
+            return dict(zip(endpoints, pool.map(lambda endpoint: self._check(*endpoint), endpoints), strict=True))
+
+    def running_apps(self) -> list[dict[str, Any]]:
+        # One pass keeps the newest entry per (app_id, host, port); only those are probed
+        best: dict[tuple[str, str, int], dict[str, Any]] = {}
+        shadowed: list[dict[str, Any]] = []
+        for entry in self._registered():
+            key = (entry['app_id'], entry['host'], int(entry['port']))
+            prev = best.get(key)
+            if prev is None:
+                best[key] = entry
+            elif entry.get('started_at', 0.0) > prev.get('started_at', 0.0):
+                best[key] = entry
+                shadowed.append(prev)
+            else:
+                shadowed.append(entry)
+
+        probed = self._probe_all(list(best.values()))
+        alive: dict[tuple[str, str, int], bool] = {}
+        running: list[dict[str, Any]] = []
+        for key, entry in best.items():
+            alive[key] = self._settle(entry, probed[self._endpoint_of(entry)])
+            if not alive[key]:
+                continue
+            running.append(
+                {
+                    'app_id': entry['app_id'],
+                    'host': entry['host'],
+                    'port': int(entry['port']),
+                    'pid': int(entry.get('pid', 0)),
+                    'readonly': bool(entry.get('readonly', False)),
+                }
+            )
+        # Older duplicates share their endpoint's check — settled by their own pid
+        for entry in shadowed:
+            key = (entry['app_id'], entry['host'], int(entry['port']))
+            if not alive[key]:
+                self._settle(entry, probed[self._endpoint_of(best[key])])
+        return sorted(running, key=lambda item: (item['app_id'], item['port']))
+
+    def _format_running(self, running: list[dict[str, Any]]) -> str:
+        return _format_running_digest(
+            tuple((item['app_id'], item['host'], item['port'], item['pid'], item['readonly']) for item in running)
+        )
+
+    def resolve(self, app_id: str) -> dict[str, Any]:
+        candidates = [
+            entry
+            for entry in sorted(self._registered(), key=lambda item: item.get('started_at', 0.0), reverse=True)
+            if entry.get('app_id') == app_id
+        ]
+
+        for entry in candidates:
+            if self._is_alive(entry):
+                return entry
+
+        running = self.running_apps()
+        raise _AppResolutionError(
+            f"Unknown app_id '{app_id}'. Running apps: {self._format_running(running)}"
+        )
+
+    def _client_for(self, app_id: str | None) -> _DevToolsClient:
+        if self._direct_client is not None and app_id is None:
+            return self._direct_client
+
+        if not app_id:
+            running = self.running_apps()
+            raise _AppResolutionError(
+                f'app_id is required. Running apps: {self._format_running(running)}'
+            )
+
+        return self._get_client(*self._endpoint_of(self.resolve(app_id)))
+
+    def request(self, *, app_id: str | None, method: str, **params):
+        result = self._client_for(app_id).request(method, **params)
+        self._start_keepalive()
+        return result
+
+    def request_many(self, *, app_id: str | None, calls: list[tuple[str, dict[str, Any]]]) -> list[dict[str, Any]]:
+        results = self._client_for(app_id).request_many(calls)
+        self._start_keepalive()
+        return results
@@ -144,8 +144,15 @@ class DevTools:
         host: str = 'localhost',
         readonly: bool = False,
         app_id: str | None = None,
+        unix_path: str | None = None,
     ) -> None:
-        """Start the inspection server in a background thread."""
+        """
+        Start the inspection server in a background thread.
+
+        The server also listens on a Unix domain socket (skips the loopback
+        TCP stack) — at unix_path if given, for bridges started with --socket,
+        else at a per-process path that the registry advertises to app_id routing.
+        """
         if self._server is not None:
             log.warning('devtools: server already running')
             return
@@ -159,6 +166,7 @@ class DevTools:
             app_id=resolved_app_id,
             invoke_fn=self._invoke_fn,
             readonly=readonly,
+            unix_path=unix_path,
         )
         # Propagate callbacks if already set before start()
         if self._screenshot_fn is not None:
@@ -171,6 +179,8 @@ class DevTools:
         if readonly:
             log.warning('python-devtools: readonly mode — mutation tools disabled')
         log.info(f'devtools: listening on {self._server.host}:{self._server.port} (app_id={self._server.app_id})')
+        if self._server.unix_path:
+            log.info(f'devtools: listening on {self._server.unix_path}')
 
     def stop(self) -> None:
         """Stop the inspection server."""
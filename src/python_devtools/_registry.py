@@ -4,15 +4,48 @@ from __future__ import annotations
 
 import json
 import os
+import socket
 import time
-from glob import glob
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+# Same optional orjson speedup as the bridge codec; entries are tiny, but the
+# bridge re-lists the registry on most routed calls.
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 _CACHE_DIR = os.path.join(
     os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
     'python-devtools',
 )
-_REGISTRY_DIR = os.path.join(_CACHE_DIR, 'registry')
+# Prefer the per-user runtime dir (tmpfs, owner-only, cleared on logout/reboot)
+# where the platform provides one: registry churn never touches a disk, and
+# entries don't outlive the processes they describe. Else the XDG cache dir.
+# MCP hosts often launch the bridge with a trimmed environment, so a missing
+# XDG_RUNTIME_DIR falls back to the systemd default rather than the cache.
+_RUNTIME_DIR = os.environ.get('XDG_RUNTIME_DIR') or (
+    f'/run/user/{os.getuid()}' if hasattr(os, 'getuid') else None
+)
+_RUNTIME_REGISTRY_DIR = os.path.join(_RUNTIME_DIR, 'python-devtools', 'registry') if _RUNTIME_DIR else None
+if _RUNTIME_DIR and os.path.isdir(_RUNTIME_DIR):
+    _STATE_DIR = os.path.join(_RUNTIME_DIR, 'python-devtools')
+else:
+    _STATE_DIR = _CACHE_DIR
+_REGISTRY_DIR = os.path.join(_STATE_DIR, 'registry')
+# Both are always listed, whichever this process writes to: apps started
+# without a runtime dir (services, older versions) register under the cache
+# dir, and apps started with one are found by a bridge that lacks it
+_REGISTRY_DIRS = tuple(
+    dict.fromkeys(d for d in (_REGISTRY_DIR, _RUNTIME_REGISTRY_DIR, os.path.join(_CACHE_DIR, 'registry')) if d)
+)
+_SOCK_DIR = os.path.join(_STATE_DIR, 'sock')
+# sun_path is 108 bytes on Linux, 104 on macOS — stay under both
+_MAX_UNIX_PATH = 100
+# Read entry files concurrently only past this many — thread startup costs more than a few warm reads
+_PARALLEL_READ_MIN = 8
+_READ_WORKERS = 16
 
 
 def register_app(
@@ -22,6 +55,7 @@ def register_app(
     port: int,
     readonly: bool,
     pid: int | None = None,
+    unix_path: str | None = None,
 ) -> str:
     """Write one registry entry and return the file path."""
     os.makedirs(_REGISTRY_DIR, exist_ok=True)
@@ -36,6 +70,8 @@ def register_app(
         'started_at': now,
         'instance_id': f'{process_id}-{int(now * 1000)}-{int(port)}',
     }
+    if unix_path:
+        entry['unix_path'] = str(unix_path)
     path = os.path.join(_REGISTRY_DIR, f"{entry['instance_id']}.json")
     tmp = f'{path}.tmp'
     with open(tmp, 'w', encoding='utf-8') as f:
@@ -44,8 +80,28 @@ def register_app(
     return path
 
 
+def default_unix_path(port: int) -> str | None:
+    """
+    Per-process Unix socket path for a server on port, creating its directory.
+
+    None where AF_UNIX is unavailable or the path would be too long to bind.
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    path = os.path.join(_SOCK_DIR, f'{os.getpid()}-{int(port)}.sock')
+    if len(path.encode()) > _MAX_UNIX_PATH:
+        return None
+    os.makedirs(_SOCK_DIR, mode=0o700, exist_ok=True)
+    return path
+
+
 def unregister_app(path: str | None) -> None:
-    """Remove one registry entry path if present."""
+    """
+    Remove one registry entry path if present.
+
+    An entry's Unix socket file is left alone: only the server that owns it
+    removes it (on stop, or when replacing it as stale on a later start).
+    """
     if not path:
         return
     try:
@@ -54,39 +110,87 @@ def unregister_app(path: str | None) -> None:
         pass
 
 
+# Parsed entries by file path, with the (mtime_ns, size) they were read at.
+# Entry files are written once (atomic replace) and never edited in place,
+# so a matching stat means the file needn't be opened again.
+_PARSED: dict[str, tuple[tuple[int, int], dict[str, Any] | None]] = {}
+
+
+def _read_one(path: str) -> dict[str, Any] | None:
+    """Parse and validate one registry file; None if it vanished or is malformed."""
+    try:
+        with open(path, 'rb') as f:
+            raw = _loads(f.read())
+    except (OSError, ValueError):  # JSONDecodeError (both codecs) and bad UTF-8 are ValueErrors
+        return None
+
+    # Files are self-written, so build straight from subscripts and let a
+    # malformed one (not an object, missing key, bad number) fail as a whole
+    try:
+        entry = {
+            'app_id': raw['app_id'],
+            'host': raw['host'],
+            'port': raw['port'],
+            'readonly': bool(raw.get('readonly', False)),
+            'pid': int(raw.get('pid', 0)),
+            'started_at': float(raw.get('started_at', 0.0)),
+            'instance_id': str(raw.get('instance_id', os.path.basename(path))),
+            'unix_path': raw.get('unix_path') or None,
+            'registry_path': path,
+        }
+    except (KeyError, TypeError, ValueError):
+        return None
+    if not (
+        entry['app_id']
+        and entry['host']
+        and type(entry['app_id']) is str
+        and type(entry['host']) is str
+        and type(entry['port']) is int
+    ):
+        return None
+    if type(entry['unix_path']) is not str:  # Optional — TCP still works without it
+        entry['unix_path'] = None
+    return entry
+
+
 def list_registered_apps() -> list[dict[str, Any]]:
     """Return all syntactically valid registry entries."""
-    entries: list[dict[str, Any]] = []
-    if not os.path.isdir(_REGISTRY_DIR):
-        return entries
-
-    for path in glob(os.path.join(_REGISTRY_DIR, '*.json')):
+    # One read per directory; no glob pattern compilation or per-name fnmatch
+    stamps: dict[str, tuple[int, int]] = {}
+    for registry_dir in _REGISTRY_DIRS:
         try:
-            with open(path, encoding='utf-8') as f:
-                raw = json.load(f)
-        except (FileNotFoundError, OSError, json.JSONDecodeError):
+            with os.scandir(registry_dir) as it:
+                for e in it:
+                    if not e.name.endswith('.json') or e.name.startswith('.'):
+                        continue
+                    try:
+                        st = e.stat()
+                    except OSError:  # Unregistered since the listing, or unreadable
+                        continue
+                    stamps[e.path] = (st.st_mtime_ns, st.st_size)
+        except OSError:  # Missing or unreadable dir — no entries from it
             continue
 
-        app_id = raw.get('app_id')
-        host = raw.get('host')
-        port = raw.get('port')
-        if not isinstance(app_id, str) or not app_id:
-            continue
-        if not isinstance(host, str) or not host:
-            continue
-        if not isinstance(port, int):
-            continue
+    for path in _PARSED.keys() - stamps.keys():  # Forget removed entries
+        _PARSED.pop(path, None)
+    found: dict[str, dict[str, Any] | None] = {}
+    stale: list[str] = []
+    for path, stamp in stamps.items():
+        cached = _PARSED.get(path)
+        if cached is not None and cached[0] == stamp:
+            found[path] = cached[1]
+        else:
+            stale.append(path)
+
+    if len(stale) < _PARALLEL_READ_MIN:
+        parsed = map(_read_one, stale)
+    else:
+        # Overlap the reads on a cold page cache — open/read release the GIL
+        with ThreadPoolExecutor(max_workers=min(_READ_WORKERS, len(stale))) as pool:
+            parsed = list(pool.map(_read_one, stale))
+    for path, entry in zip(stale, parsed, strict=True):
+        _PARSED[path] = (stamps[path], entry)
+        found[path] = entry
 
-        entries.append(
-            {
-                'app_id': app_id,
-                'host': host,
-                'port': port,
-                'readonly': bool(raw.get('readonly', False)),
-                'pid': int(raw.get('pid', 0)),
-                'started_at': float(raw.get('started_at', 0.0)),
-                'instance_id': str(raw.get('instance_id', os.path.basename(path))),
-                'registry_path': path,
-            }
-        )
-    return entries
+    # Copies — callers may annotate entries without touching the cache
+    return [dict(entry) for entry in found.values() if entry is not None]
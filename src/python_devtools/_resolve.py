@@ -4,24 +4,105 @@ from __future__ import annotations
 
 import ast
 import contextlib
+import functools
 import inspect
 import io
+import itertools
+import keyword
 import re
+import threading
 import types
 from collections import Counter
-from collections.abc import Mapping, Sequence, Set
+from collections.abc import Iterable, Mapping, Sequence, Set
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(source: str, mode: str) -> types.CodeType:
+    """
+    compile() memoized on (source, mode) — agents re-ask the same paths and
+    expressions, so parsing and compiling is paid once per distinct string.
+
+    Same filename and inherited flags as eval(str), so error messages match.
+    """
+    return compile(source, '<string>', mode)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_run(code: str) -> tuple[types.CodeType | None, types.CodeType | None]:
+    """
+    Compile run_code input into (statements, tail expression) — either may be None.
+
+    A single expression is all tail. Otherwise, if the last statement is an
+    expression, the rest is exec'd first and the tail is eval'd for its value.
+    Raises SyntaxError (from ast.parse) for invalid code.
+    """
+    try:
+        return None, _compile(code, 'eval')
+    except SyntaxError:
+        pass
+    tree = ast.parse(code)
+    if tree.body and isinstance(tree.body[-1], ast.Expr):
+        setup = None
+        if len(tree.body) > 1:
+            setup = compile(ast.Module(body=tree.body[:-1], type_ignores=[]), '<devtools>', 'exec')
+        return setup, compile(ast.Expression(body=tree.body[-1].value), '<devtools>', 'eval')
+    return _compile(code, 'exec'), None
+
+
+# Plain access paths — a name, then .attr / [int] / ['str'] / ["str"] steps.
+# ASCII only: eval() NFKC-normalizes other identifiers, plain getattr wouldn't.
+_SIMPLE_PATH_RE = re.compile(
+    r'([A-Za-z_]\w*)(?:\.[A-Za-z_]\w*|\[-?(?:0|[1-9]\d*)\]|\[\'[^\'\\\n]*\'\]|\["[^"\\\n]*"\])*',
+    re.ASCII,
+)
+_PATH_STEP_RE = re.compile(
+    r'\.([A-Za-z_]\w*)|\[(-?(?:0|[1-9]\d*))\]|\[\'([^\'\\\n]*)\'\]|\["([^"\\\n]*)"\]',
+    re.ASCII,
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _simple_steps(path: str) -> tuple[str, tuple[tuple[bool, object], ...]] | None:
+    """
+    Parse a plain access path into (head name, ((is_attr, name_or_key), ...)).
+
+    None when the path needs eval() — any other syntax, or a keyword where
+    a name should be (eval would reject it; getattr wouldn't).
+    """
+    m = _SIMPLE_PATH_RE.fullmatch(path)
+    if m is None or keyword.iskeyword(m.group(1)):
+        return None
+    steps: list[tuple[bool, object]] = []
+    for attr, index, single, double in _PATH_STEP_RE.findall(path, m.end(1)):
+        if attr:
+            if keyword.iskeyword(attr):
+                return None
+            steps.append((True, attr))
+        elif index:
+            steps.append((False, int(index)))
+        else:
+            steps.append((False, single or double))
+    return m.group(1), tuple(steps)
 
 
 def resolve(path: str, namespaces: dict[str, object]) -> object:
     """
     Resolve a dotted path with optional indexing against registered namespaces.
 
-    Uses eval() — intentionally unrestricted for dev use. Handles:
+    Plain paths on a registered name are walked with getattr/[] directly —
+    same lookups as eval(), without the compiler. Anything else goes through
+    eval() — intentionally unrestricted for dev use. Handles:
         'app'                    → namespaces['app']
         'app.hobos[0].session'   → attribute + index traversal
         'len(app.hobos)'         → arbitrary expressions
     """
-    return eval(path, {'__builtins__': __builtins__}, namespaces)
+    plan = _simple_steps(path)
+    if plan is not None and plan[0] in namespaces:
+        obj = namespaces[plan[0]]
+        for is_attr, key in plan[1]:
+            obj = getattr(obj, key) if is_attr else obj[key]  # type: ignore[index]
+        return obj
+    return eval(_compile(path, 'eval'), {'__builtins__': __builtins__}, namespaces)
 
 
 # ────────────────────────────────────────────────────────────────────────
@@ -35,6 +116,11 @@ _TOP_PATTERN_LIMIT = 8
 _TIMESTAMP_PREFIX_RE = re.compile(r'^\[\d+(?:\.\d+)?\]\s*')
 _NUMBER_RE = re.compile(r'-?\d+(?:\.\d+)?')
 _SPACE_RE = re.compile(r'\s+')
+# redirect_stdout swaps the process-wide sys.stdout. Two overlapping
+# captures (one server thread per client connection) would restore each
+# other's StringIO and leave stdout pointing at a dead buffer, so exec/eval
+# runs one at a time. Reads never touch stdout and stay concurrent.
+_STDOUT_LOCK = threading.Lock()
 
 
 def _clip_preview_line(line: str, *, maxlen: int = _PREVIEW_LINE_MAXLEN) -> str:
@@ -206,32 +292,21 @@ def run_code(
                 d['stdout_summary'] = stdout_summary
         return d
 
-    with contextlib.redirect_stdout(capture):
-        # Fast path — single expression
-        try:
-            result = eval(code, ns)
-            return _result(result, 'eval')
-        except SyntaxError:
-            pass
-
-        # Parse AST to check if last statement is an expression
-        try:
-            tree = ast.parse(code)
-        except SyntaxError as e:
-            return {'error': f'SyntaxError: {e}'}
-
-        # If the last statement is an expression (not assignment, import, etc.),
-        # exec everything before it, then eval the tail — return its value
-        if tree.body and isinstance(tree.body[-1], ast.Expr):
-            if len(tree.body) > 1:
-                setup = ast.Module(body=tree.body[:-1], type_ignores=[])
-                exec(compile(setup, '<devtools>', 'exec'), ns)
-            expr = ast.Expression(body=tree.body[-1].value)
-            result = eval(compile(expr, '<devtools>', 'eval'), ns)
+    # Compiled once per distinct code string (see _compile_run)
+    try:
+        setup, tail = _compile_run(code)
+    except SyntaxError as e:
+        return {'error': f'SyntaxError: {e}'}
+
+    with _STDOUT_LOCK, contextlib.redirect_stdout(capture):
+        if setup is not None:
+            exec(setup, ns)
+        # If the last statement is an expression (not assignment, import, etc.)
+        # return its value
+        if tail is not None:
+            result = eval(tail, ns)
             return _result(result, 'eval')
-
-        # Pure statements — exec everything, return OK
-        exec(code, ns)
+        # Pure statements — exec'd above, return OK
 
     out = capture.getvalue()
     d: dict = {'result': 'OK', 'type': 'NoneType', 'mode': 'exec'}
@@ -320,34 +395,31 @@ def list_path(
     if isinstance(obj, Mapping) and not isinstance(obj, (str, bytes)):
         node['kind'] = 'mapping'
         node['length'] = len(obj)  # type: ignore[arg-type]
-        keys = []
-        for i, k in enumerate(obj):
-            if i >= max_items:
-                node['truncated'] = True
-                break
-            keys.append(repr(k))
-        node['keys'] = keys
+        head, more = _take(obj, max_items)
+        if more:
+            node['truncated'] = True
+        node['keys'] = [repr(k) for k in head]
         return node
 
     # ── Sequences & sets ──
     if isinstance(obj, (Sequence, Set)) and not isinstance(obj, (str, bytes)):
         node['kind'] = 'sequence'
         node['length'] = len(obj)  # type: ignore[arg-type]
-        items = []
-        for i, item in enumerate(obj):
-            if i >= max_items:
-                node['truncated'] = True
-                break
-            items.append({
+        head, more = _take(obj, max_items)
+        if more:
+            node['truncated'] = True
+        node['items'] = [
+            {
                 'type': type(item).__qualname__,
                 'repr': _safe_repr(item, maxlen=max_repr_len),
-            })
-        node['items'] = items
+            }
+            for item in head
+        ]
         return node
 
     # ── General object ──
     node['kind'] = 'object'
-    attrs = _get_public_attrs(obj, max_items=max_items)
+    attrs, methods, n_public = _classify_public(obj, max_items=max_items)
     node['attrs'] = [
         {
             'name': n,
@@ -356,11 +428,10 @@ def list_path(
         }
         for n, v in attrs
     ]
-    node['methods'] = _get_public_methods(obj, max_items=max_items)
+    node['methods'] = methods
 
     # Truncation check for attrs + methods combined
-    all_public = [n for n in dir(obj) if not n.startswith('_')]
-    if len(all_public) > max_items:
+    if n_public > max_items:
         node['truncated'] = True
 
     return node
@@ -410,8 +481,38 @@ def call_path(
         }
 
 
-# Regex for bracket indexing at end of path: foo.bar[0] or foo['key']
-_BRACKET_TAIL_RE = re.compile(r'^(.+)\[(.+)\]$')
+def _split_bracket_tail(path: str) -> tuple[str, str] | None:
+    """
+    Split 'foo.bar[key]' into ('foo.bar', 'key') if path ends in a top-level [...].
+
+    One left-to-right pass tracking bracket depth and string literals, so
+    keys holding brackets, dots or quotes — d[k[0]], d['a]b'] — split where
+    Python would. None if there's no such tail (or nothing before it).
+    """
+    depth = 0
+    start = -1  # Index of the '[' opening the current top-level group
+    quote = ''
+    escaped = False
+    end = len(path) - 1
+    for i, ch in enumerate(path):
+        if quote:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == quote:
+                quote = ''
+        elif ch in '\'"':
+            quote = ch
+        elif ch == '[':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == ']' and depth:
+            depth -= 1
+            if depth == 0 and i == end and start > 0 and i - start > 1:
+                return path[:start], path[start + 1:i]
+    return None
 
 
 def set_value(
@@ -420,16 +521,19 @@ def set_value(
     value_expr: str,
 ) -> dict:
     """Set a value on an object — supports dot attrs and bracket indexing."""
-    val = eval(value_expr, {'__builtins__': __builtins__}, namespaces)
+    val = eval(_compile(value_expr, 'eval'), {'__builtins__': __builtins__}, namespaces)
 
     try:
         # Try bracket indexing first: path like 'obj.data[0]' or 'obj.data["key"]'
-        m = _BRACKET_TAIL_RE.match(path)
-        if m:
-            parent_path, key_expr = m.group(1), m.group(2)
+        tail = _split_bracket_tail(path)
+        if tail is not None:
+            parent_path, key_expr = tail
             parent = resolve(parent_path, namespaces)
-            key = eval(key_expr, {'__builtins__': __builtins__}, namespaces)
+            key = eval(_compile(key_expr, 'eval'), {'__builtins__': __builtins__}, namespaces)
             parent[key] = val  # type: ignore[index]
+        elif path.endswith(']'):
+            # Unbalanced or empty index — don't fall through and store it as a name
+            raise SyntaxError(f'invalid index in path: {path!r}')
         else:
             # Dot-separated: split into parent + attr
             dot = path.rfind('.')
@@ -465,11 +569,9 @@ def _serialize_obj(
     max_depth: int = 2,
     max_items: int = 50,
     max_repr_len: int = 200,
-    _depth: int = 0,
-    _seen: set[int] | None = None,
 ) -> dict:
     """
-    Recursive bounded serializer — turns an object into a JSON-safe dict.
+    Bounded serializer — turns an object graph into a JSON-safe dict.
 
     Returns dict with keys:
         type  — qualname of the object's class
@@ -481,99 +583,124 @@ def _serialize_obj(
         length    — element count for sized containers
         truncated — true when items/attrs/entries were capped at max_items
 
-    Cycle detection via id() prevents infinite loops on self-referential
-    structures. Depth gating prevents runaway recursion on deep graphs.
+    Walks depth-first with an explicit stack, visiting nodes in the same
+    order recursion would, but without a frame per node or a recursion
+    limit. Children are queued as empty dicts already placed in their
+    parent, then filled in when popped. Cycle detection via id() against
+    the current branch prevents infinite loops on self-referential
+    structures. Depth gating bounds the walk on deep graphs.
     """
-    if _seen is None:
-        _seen = set()
-
-    tname = type(obj).__qualname__
-    rstr = _safe_repr(obj, maxlen=max_repr_len)
-
-    # Cycle detection — bail with marker
-    oid = id(obj)
-    if oid in _seen:
-        return {'type': tname, 'repr': '<circular ref>'}
-    _seen.add(oid)
-
-    # Base node — always present
-    node: dict = {'type': tname, 'repr': rstr}
+    root: dict = {}
+    stack: list[tuple[object, dict, int]] = [(obj, root, 0)]
+    # ids of the branch above the node being filled — path[d] is its depth-d ancestor
+    path: list[int] = []
+
+    while stack:
+        obj, node, depth = stack.pop()
+        del path[depth:]  # Leave whatever branch the previous node was on
+
+        # Cycle detection — mark and move on
+        tname = type(obj).__qualname__
+        oid = id(obj)
+        if oid in path:
+            node['type'] = tname
+            node['repr'] = '<circular ref>'
+            continue
 
-    # Length for sized containers
-    if isinstance(obj, (Mapping, Sequence, Set)) and not isinstance(obj, (str, bytes)):
-        try:
-            node['length'] = len(obj)  # type: ignore[arg-type]
-        except Exception:
-            pass
+        # Base fields — always present
+        node['type'] = tname
+        node['repr'] = _safe_repr(obj, maxlen=max_repr_len)
 
-    # At max depth, return just type+repr — no recursion into children
-    if _depth >= max_depth:
-        _seen.discard(oid)
-        return node
+        # Length for sized containers
+        if isinstance(obj, (Mapping, Sequence, Set)) and not isinstance(obj, (str, bytes)):
+            try:
+                node['length'] = len(obj)  # type: ignore[arg-type]
+            except Exception:
+                pass
 
-    # Recurse kwargs for children
-    rkw = dict(
-        max_depth=max_depth,
-        max_items=max_items,
-        max_repr_len=max_repr_len,
-        _depth=_depth + 1,
-        _seen=_seen,
-    )
+        # At max depth, just type+repr — no descent into children
+        if depth >= max_depth:
+            continue
+        path.append(oid)
+        children: list[tuple[object, dict, int]] = []
 
-    # ── Mappings (dict-like) ──
-    if isinstance(obj, Mapping) and not isinstance(obj, (str, bytes)):
-        entries = []
-        items_iter = iter(obj.items())
-        for i, (k, v) in enumerate(items_iter):
-            if i >= max_items:
+        # ── Mappings (dict-like) ──
+        if isinstance(obj, Mapping) and not isinstance(obj, (str, bytes)):
+            head, more = _take(obj.items(), max_items)
+            if more:
                 node['truncated'] = True
-                break
-            entries.append({
-                'key': _safe_repr(k, maxlen=max_repr_len),
-                'value': _serialize_obj(v, **rkw),
-            })
-        if entries:
-            node['entries'] = entries
-
-    # ── Sequences & sets (list, tuple, set, frozenset, ...) ──
-    elif isinstance(obj, (Sequence, Set)) and not isinstance(obj, (str, bytes)):
-        items = []
-        items_iter = iter(obj)
-        for i, item in enumerate(items_iter):
-            if i >= max_items:
+            entries = []
+            for k, v in head:
+                child: dict = {}
+                entries.append({'key': _safe_repr(k, maxlen=max_repr_len), 'value': child})
+                children.append((v, child, depth + 1))
+            if entries:
+                node['entries'] = entries
+
+        # ── Sequences & sets (list, tuple, set, frozenset, ...) ──
+        elif isinstance(obj, (Sequence, Set)) and not isinstance(obj, (str, bytes)):
+            head, more = _take(obj, max_items)
+            if more:
                 node['truncated'] = True
-                break
-            items.append(_serialize_obj(item, **rkw))
-        if items:
-            node['items'] = items
-
-    # ── General objects — serialize public attrs ──
-    else:
-        attrs_list = _get_public_attrs(obj, max_items=max_items)
-        if attrs_list:
-            serialized = []
-            for name, val in attrs_list:
-                serialized.append({
-                    'name': name,
-                    'type': type(val).__name__,
-                    'repr': _safe_repr(val, maxlen=max_repr_len),
-                })
-            node['attrs'] = serialized
-            # Flag truncation if _get_public_attrs hit its cap
-            all_public = [n for n in dir(obj) if not n.startswith('_')]
-            if len(all_public) > max_items:
-                node['truncated'] = True
-
-    _seen.discard(oid)
-    return node
+            items = []
+            for item in head:
+                child = {}
+                items.append(child)
+                children.append((item, child, depth + 1))
+            if items:
+                node['items'] = items
+
+        # ── General objects — serialize public attrs ──
+        else:
+            attrs_list, _, n_public = _classify_public(obj, max_items=max_items, methods=False)
+            if attrs_list:
+                serialized = []
+                for name, val in attrs_list:
+                    serialized.append({
+                        'name': name,
+                        'type': type(val).__name__,
+                        'repr': _safe_repr(val, maxlen=max_repr_len),
+                    })
+                node['attrs'] = serialized
+                # Flag truncation if there were more public names than the cap
+                if n_public > max_items:
+                    node['truncated'] = True
+
+        # Reversed, so the first child is popped (and filled) first
+        children.reverse()
+        stack.extend(children)
+
+    return root
 
 
 # ────────────────────────────────────────────────────────────────────────
 # Helpers
 # ────────────────────────────────────────────────────────────────────────
 
+_NOTHING = object()
+
+
+def _take(iterable: Iterable, n: int) -> tuple[list, bool]:
+    """The first n items (counted by islice, in C), and whether more followed."""
+    it = iter(iterable)
+    head = list(itertools.islice(it, max(n, 0)))
+    return head, next(it, _NOTHING) is not _NOTHING
+
+
+# Types whose repr can neither raise nor exceed _SHORT_REPR_LEN chars
+# ('-1.7976931348623157e+308' is the longest float). Ints qualify below _SHORT_INT.
+_SHORT_REPR_TYPES = frozenset({bool, float, type(None)})
+_SHORT_REPR_LEN = 24
+_SHORT_INT = 1 << 64
+
+
 def _safe_repr(obj: object, maxlen: int = 200) -> str:
     """Repr with truncation and error safety."""
+    # Scalars dominate container/attr listings — skip the guard and length check
+    if maxlen >= _SHORT_REPR_LEN:
+        t = type(obj)
+        if t in _SHORT_REPR_TYPES or (t is int and -_SHORT_INT < obj < _SHORT_INT):  # type: ignore[operator]
+            return repr(obj)
     try:
         r = repr(obj)
     except Exception as e:
@@ -583,37 +710,73 @@ def _safe_repr(obj: object, maxlen: int = 200) -> str:
     return r
 
 
-def _get_public_attrs(obj: object, *, max_items: int = 50) -> list[tuple[str, object]]:
-    """Get non-dunder, non-callable attributes with their values, sorted."""
-    attrs = []
-    for name in sorted(dir(obj)):
-        if name.startswith('_'):
-            continue
-        try:
-            val = getattr(obj, name)
-        except Exception:
-            continue
-        # Skip methods/functions — we want state, not API surface
-        if callable(val) and not isinstance(val, (type, types.ModuleType)):
-            continue
-        attrs.append((name, val))
-        if len(attrs) >= max_items:
-            break
-    return attrs
+# Public class-level names per type, for _public_names. Each entry keeps the
+# MRO and every class's attribute names it was built from; any change to
+# either (monkeypatching, reloads, swapped bases) rebuilds it. Cleared when
+# it grows past _CLASS_NAMES_MAX rather than tracked with weakrefs.
+_CLASS_NAMES: dict[type, tuple[tuple[type, ...], list[frozenset[str]], frozenset[str]]] = {}
+_CLASS_NAMES_MAX = 1024
 
 
-def _get_public_methods(obj: object, *, max_items: int = 50) -> list[str]:
-    """Get non-dunder callable names — complement to _get_public_attrs."""
-    methods = []
-    for name in sorted(dir(obj)):
-        if name.startswith('_'):
-            continue
+def _public_names(obj: object) -> list[str]:
+    """
+    Sorted public names of dir(obj).
+
+    For objects on the default object.__dir__, the class part comes from a
+    per-type cache and only the instance __dict__ is read per call.
+    Anything else calls dir().
+    """
+    t = type(obj)
+    if t.__dir__ is not object.__dir__ or obj.__class__ is not t:
+        return sorted(name for name in dir(obj) if not name.startswith('_'))
+
+    mro = t.__mro__
+    hit = _CLASS_NAMES.get(t)
+    # dict_keys == frozenset compares as sets, in C — no per-call key copies
+    if hit is None or hit[0] != mro or [vars(c).keys() for c in mro] != hit[1]:
+        if len(_CLASS_NAMES) >= _CLASS_NAMES_MAX:
+            _CLASS_NAMES.clear()
+        keys = [frozenset(vars(c)) for c in mro]
+        # The class part of object.__dir__ is the union of these vars() —
+        # not dir(t), which a metaclass __dir__ may override
+        names = frozenset(n for n in frozenset().union(*keys) if type(n) is str and not n.startswith('_'))
+        hit = _CLASS_NAMES[t] = (mro, keys, names)
+
+    inst = getattr(obj, '__dict__', None)
+    if not inst:
+        return sorted(hit[2])
+    return sorted(hit[2].union([k for k in inst if type(k) is str and not k.startswith('_')]))
+
+
+def _classify_public(
+    obj: object,
+    *,
+    max_items: int = 50,
+    methods: bool = True,
+) -> tuple[list[tuple[str, object]], list[str], int]:
+    """
+    One pass over sorted dir(obj): public state attrs and public callables.
+
+    Returns ((name, value) attrs, method names, total public names). Attrs
+    and methods are each capped at max_items; every name is fetched at most
+    once, and the walk stops when both lists are full (attrs alone if
+    methods=False). Classes and modules count as state, not API surface.
+    """
+    public = _public_names(obj)
+    cap = max(max_items, 1)
+    method_cap = cap if methods else 0
+    attrs: list[tuple[str, object]] = []
+    method_names: list[str] = []
+    for name in public:
+        if len(attrs) >= cap and len(method_names) >= method_cap:
+            break
         try:
             val = getattr(obj, name)
         except Exception:
             continue
         if callable(val) and not isinstance(val, (type, types.ModuleType)):
-            methods.append(name)
-            if len(methods) >= max_items:
-                break
-    return methods
+            if len(method_names) < method_cap:
+                method_names.append(name)
+        elif len(attrs) < cap:
+            attrs.append((name, val))
+    return attrs, method_names, len(public)
@@ -1,7 +1,8 @@
 """
 TCP inspection server — pure stdlib, zero dependencies.
 
-Speaks JSON-lines over TCP. Each line is a JSON object:
+Speaks JSON-lines over TCP, and optionally over a Unix domain socket as
+well (unix_path) for bridges on the same machine. Each line is a JSON object:
     Request:  {"id": 1, "method": "eval", "params": {"code": "len(app.hobos)"}}
     Response: {"id": 1, "result": {"value": "2", "type": "int"}}
     Error:    {"id": 1, "error": "NameError: name 'foo' is not defined"}
@@ -18,11 +19,20 @@ Methods:
     screenshot()             — Capture current GUI state as PNG (app-dependent)
     winshot(code)            — Render code in offscreen window, return PNG (app-dependent)
     ping()                   — Liveness check, returns 'pong'
+                               (a bare NUL-byte line gets a 0x01 line back — no JSON)
     version()                — Returns server version string
     logs(...)                — Indexed log tail/pagination/follow for debugging
+    batch(calls)             — Run [{method, params}, ...] in one round trip
+
+Binary results:
+    screenshot/winshot accept binary=true. The response line then carries
+    {"format": "png", "encoding": "binary", "size": N} and is followed by
+    exactly N raw PNG bytes, instead of base64 inside the JSON. Clients that
+    don't ask keep getting base64.
 
 Protocol robustness:
-    - Loopback-only: non-loopback peers are rejected immediately
+    - Loopback-only: non-loopback TCP peers are rejected immediately
+    - Unix socket (if enabled) is created owner-only (0600)
     - Bounded recv buffer: clients exceeding 1MB are disconnected
     - Readonly mode: eval/call/set/winshot methods can be disabled
 
@@ -34,10 +44,13 @@ Threading safety:
 
 from __future__ import annotations
 
+import base64
 import ipaddress
 import json
 import logging
+import os
 import socket
+import stat
 import threading
 import time
 import traceback
@@ -45,6 +58,23 @@ from collections import deque
 from collections.abc import Callable
 from typing import Any
 
+# Used opportunistically when the app's environment has it; never required
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from python_devtools._resolve import (
+    call_path,
+    get_source,
+    inspect_object,
+    list_path,
+    list_state,
+    repr_path,
+    run_code,
+    set_value,
+)
+
 log = logging.getLogger('python-devtools')
 
 VERSION = 'python-devtools 0.2.0'
@@ -52,15 +82,52 @@ VERSION = 'python-devtools 0.2.0'
 # Methods that mutate app state — blocked in readonly mode
 _MUTATION_METHODS = frozenset({'eval', 'call', 'set', 'winshot'})
 
-# Maximum recv buffer before force-disconnect (1MB)
+# Maximum request line before force-disconnect (1MB)
 _MAX_BUF = 1_000_000
 
+# Keepalive frame: a line holding one NUL byte is answered with one 0x01 byte
+# and a newline — no JSON either way. Used for cheap liveness checks.
+_KEEPALIVE = b'\x00\n'
+_KEEPALIVE_ACK = b'\x01\n'
+
 # Log history retained for MCP log queries
 _MAX_LOG_ENTRIES = 5_000
 
 # Upper bound for blocking log follow calls
 _MAX_LOG_WAIT_SECONDS = 30.0
 
+# Compact response encoder — no padding after ',' and ':' on the wire.
+# One shared instance; json.dumps(separators=...) would build one per call.
+# Non-ASCII text goes out as UTF-8 rather than \uXXXX escapes (half the bytes
+# or less). No circular check: responses are built fresh from strings, numbers
+# and containers, and _serialize_obj already breaks object cycles.
+_encode = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False, check_circular=False).encode
+
+# orjson writes the same compact UTF-8 line straight to bytes. Non-str keys
+# are stringified the way json does; what it still refuses (ints past 64
+# bits, lone surrogates) takes the stdlib path below.
+if orjson is not None:
+    _loads = orjson.loads
+    _ORJSON_OPTS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+else:
+    _loads = json.loads
+
+
+def _frame(obj: Any) -> bytes:
+    """Encode one response as a wire-ready line, newline included."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTS)
+        except TypeError:  # orjson.JSONEncodeError
+            pass
+    line = f'{_encode(obj)}\n'
+    try:
+        return line.encode()
+    except UnicodeEncodeError:
+        # Lone surrogates (e.g. surrogateescape'd filenames) have no UTF-8 form,
+        # and strict JSON parsers reject them escaped too — substitute them
+        return line.encode('utf-8', 'replace')
+
 
 def _parse_level(level: str | None) -> int:
     """Parse a logging level string; defaults to NOTSET for unknown input."""
@@ -201,6 +268,40 @@ class _LogCaptureHandler(logging.Handler):
             pass
 
 
+class _RawResult:
+    """
+    A bulk bytes result (PNG captures).
+
+    binary: sent as a JSON header line followed by the raw payload bytes.
+    Otherwise inline base64 — _dispatch splices the encoded payload into the
+    response line rather than building it as a str inside the JSON.
+    """
+
+    __slots__ = ('binary', 'data', 'format')
+
+    def __init__(self, data: bytes, fmt: str, *, binary: bool = True):
+        self.data = data
+        self.format = fmt
+        self.binary = binary
+
+    def header(self) -> dict[str, Any]:
+        encoding = 'binary' if self.binary else 'base64'
+        return {'format': self.format, 'encoding': encoding, 'size': len(self.data)}
+
+    def as_base64(self) -> dict[str, Any]:
+        return {
+            'format': self.format,
+            'encoding': 'base64',
+            'size': len(self.data),
+            'data': base64.b64encode(self.data).decode('ascii'),
+        }
+
+
+def _png_result(png_bytes: bytes, params: dict[str, Any]) -> _RawResult:
+    """Wrap captured PNG bytes — raw if the client asked for binary, else base64 JSON."""
+    return _RawResult(png_bytes, 'png', binary=bool(params.get('binary')))
+
+
 class _Server:
     """TCP JSON-lines server for runtime inspection."""
 
@@ -213,16 +314,19 @@ class _Server:
         *,
         invoke_fn: Callable | None = None,
         readonly: bool = False,
+        unix_path: str | None = None,
     ):
         self._namespaces = namespaces
         self._host = host
         self._port = port
+        self._unix_path = unix_path
         self._app_id = app_id
         self._invoke_fn = invoke_fn
         self._readonly = readonly
         self._screenshot_fn: Callable[[], bytes] | None = None
         self._winshot_fn: Callable[[str], bytes] | None = None
         self._sock: socket.socket | None = None
+        self._unix_sock: socket.socket | None = None
         self._running = False
         self._registry_path: str | None = None
         self._log_buffer = _LogBuffer()
@@ -248,29 +352,100 @@ class _Server:
     def port(self) -> int:
         return self._port
 
+    @property
+    def unix_path(self) -> str | None:
+        """Path of the Unix socket listener, or None if not listening on one."""
+        return self._unix_path if self._unix_sock is not None else None
+
     def start(self) -> None:
-        from python_devtools._registry import register_app
+        from python_devtools._registry import default_unix_path, register_app
 
         self._running = True
         root_logger = logging.getLogger()
         self._log_handler = _LogCaptureHandler(self._log_buffer)
         root_logger.addHandler(self._log_handler)
 
-        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self._sock.bind((self._host, self._port))
-        self._port = int(self._sock.getsockname()[1])
-        self._sock.listen(4)
-        self._sock.settimeout(1.0)  # So shutdown can break the accept loop
-        self._registry_path = register_app(
-            app_id=self._app_id,
-            host=self._host,
-            port=self._port,
-            readonly=self._readonly,
-        )
-
-        thread = threading.Thread(target=self._accept_loop, daemon=True, name='devtools-server')
+        # Nothing half-started survives a failure (e.g. an explicit unix_path
+        # that is taken): no listening socket, no stacked log handler on retry
+        try:
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self._sock.bind((self._host, self._port))
+            self._port = int(self._sock.getsockname()[1])
+            self._sock.listen(4)
+            self._sock.settimeout(1.0)  # So shutdown can break the accept loop
+            if self._unix_path:
+                self._unix_sock = self._listen_unix(self._unix_path)
+            elif self._host == 'localhost' or _is_loopback(self._host):
+                # Same-machine bridges find this path in the registry and skip the
+                # loopback TCP stack. Best effort — TCP alone still works.
+                try:
+                    self._unix_path = default_unix_path(self._port)
+                    if self._unix_path:
+                        self._unix_sock = self._listen_unix(self._unix_path)
+                except OSError as e:
+                    log.debug(f'devtools: no Unix socket listener ({e}) — TCP only')
+                    self._unix_path = None
+            self._registry_path = register_app(
+                app_id=self._app_id,
+                host=self._host,
+                port=self._port,
+                readonly=self._readonly,
+                unix_path=self.unix_path,
+            )
+        except BaseException:
+            if self._unix_sock is not None:
+                self._unix_sock.close()
+                self._unix_sock = None
+                try:
+                    os.unlink(self._unix_path)  # type: ignore[arg-type]
+                except OSError:
+                    pass
+            if self._sock is not None:
+                self._sock.close()
+                self._sock = None
+            root_logger.removeHandler(self._log_handler)
+            self._log_handler = None
+            self._running = False
+            raise
+
+        thread = threading.Thread(target=self._accept_loop, args=(self._sock,), daemon=True, name='devtools-server')
         thread.start()
+        if self._unix_sock is not None:
+            threading.Thread(
+                target=self._accept_loop,
+                args=(self._unix_sock,),
+                daemon=True,
+                name='devtools-server-unix',
+            ).start()
+
+    def _listen_unix(self, path: str) -> socket.socket | None:
+        """Listen on a Unix socket at path. Returns None where AF_UNIX isn't available."""
+        if not hasattr(socket, 'AF_UNIX'):
+            log.warning('devtools: Unix sockets not supported on this platform — TCP only')
+            return None
+        try:
+            st = os.lstat(path)
+        except FileNotFoundError:
+            pass
+        else:
+            # Only a dead socket left by a previous run is ours to replace —
+            # never a regular file, nor a socket another server still answers on
+            if not stat.S_ISSOCK(st.st_mode):
+                raise FileExistsError(f'{path} exists and is not a socket')
+            if _unix_in_use(path):
+                raise OSError(f'{path} is in use by another server')
+            os.unlink(path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(path)
+            os.chmod(path, 0o600)
+            sock.listen(4)
+            sock.settimeout(1.0)
+        except BaseException:
+            sock.close()
+            raise
+        return sock
 
     def shutdown(self) -> None:
         from python_devtools._registry import unregister_app
@@ -282,6 +457,13 @@ class _Server:
         if self._sock:
             self._sock.close()
             self._sock = None
+        if self._unix_sock:
+            self._unix_sock.close()
+            self._unix_sock = None
+            try:
+                os.unlink(self._unix_path)  # type: ignore[arg-type]
+            except OSError:
+                pass
         unregister_app(self._registry_path)
         self._registry_path = None
 
@@ -310,20 +492,23 @@ class _Server:
     # Accept / Handle
     # ────────────────────────────────────────────────────────────────
 
-    def _accept_loop(self) -> None:
+    def _accept_loop(self, sock: socket.socket) -> None:
         while self._running:
             try:
-                client, addr = self._sock.accept()  # type: ignore[union-attr]
+                client, addr = sock.accept()
             except TimeoutError:
                 continue
             except OSError:
                 break  # Socket closed
 
-            # Loopback guard — reject non-local peers
-            if not _is_loopback(addr[0]):
+            # Loopback guard — reject non-local TCP peers (Unix peers are local by construction)
+            if sock is not self._unix_sock and not _is_loopback(addr[0]):
                 log.warning(f'devtools: rejected non-loopback connection from {addr[0]}')
                 client.close()
                 continue
+            if sock is not self._unix_sock:
+                # Responses leave as one buffered write — Nagle would only add delay
+                client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
             log.debug(f'devtools: client connected from {addr}')
             threading.Thread(
@@ -335,31 +520,40 @@ class _Server:
 
     def _handle_client(self, client: socket.socket) -> None:
         self.n_clients += 1
-        buf = b''
+        # Buffered reader does the framing: readline() finds the newline with
+        # memchr in C and keeps any bytes past it for the next call
+        reader = client.makefile('rb', buffering=8192)
+        # Writes collect here and leave in one send per response (frame plus
+        # any payload pieces); chunks bigger than the buffer go straight through
+        writer = client.makefile('wb', buffering=65536)
         try:
             while self._running:
-                data = client.recv(8192)
-                if not data:
-                    break
-                buf += data
-
-                # Bounded buffer — disconnect runaway clients
-                if len(buf) > _MAX_BUF:
-                    log.error('devtools: client exceeded 1MB recv buffer, disconnecting')
-                    break
-
-                while b'\n' in buf:
-                    line, buf = buf.split(b'\n', 1)
-                    if not line.strip():
-                        continue
-                    self.n_commands += 1
-                    self.last_command_time = time.time()
-                    response = self._dispatch(line)
-                    client.sendall(response.encode() + b'\n')
+                line = reader.readline(_MAX_BUF + 1)
+                if not line.endswith(b'\n'):
+                    # Bounded line — disconnect runaway clients
+                    if len(line) > _MAX_BUF:
+                        log.error('devtools: client exceeded 1MB request line, disconnecting')
+                    break  # Else EOF, possibly mid-line
+                if not line.strip():
+                    continue
+                if line == _KEEPALIVE:
+                    writer.write(_KEEPALIVE_ACK)
+                    writer.flush()
+                    continue
+                self.n_commands += 1
+                self.last_command_time = time.time()
+                for chunk in self._dispatch(line):
+                    writer.write(chunk)
+                writer.flush()
         except (ConnectionResetError, BrokenPipeError, OSError):
             pass
         finally:
             self.n_clients -= 1
+            reader.close()
+            try:
+                writer.close()  # Flushes leftovers — fails if the peer is gone
+            except OSError:
+                pass
             client.close()
             log.debug('devtools: client disconnected')
 
@@ -367,11 +561,12 @@ class _Server:
     # Dispatch
     # ────────────────────────────────────────────────────────────────
 
-    def _dispatch(self, raw: bytes) -> str:
+    def _dispatch(self, raw: bytes) -> tuple[bytes, ...]:
+        """Handle one request line. Returns the response as byte chunks to send in order."""
         try:
-            req = json.loads(raw)
+            req = _loads(raw)
         except json.JSONDecodeError as e:
-            return json.dumps({'id': None, 'error': f'Invalid JSON: {e}'})
+            return (_frame({'id': None, 'error': f'Invalid JSON: {e}'}),)
 
         req_id = req.get('id')
         method = req.get('method', '')
@@ -379,11 +574,40 @@ class _Server:
 
         try:
             result = self._call(method, params)
-            return json.dumps({'id': req_id, 'result': result})
+            if isinstance(result, _RawResult):
+                head = _frame({'id': req_id, 'result': result.header()})
+                if result.binary:
+                    return head, result.data
+                # Same line as as_base64() would give, but the multi-MB payload is
+                # encoded once, straight to bytes: reopen the header's closing '}}\n'
+                return head[:-3], b',"data":"', base64.b64encode(result.data), b'"}}\n'
+            return (_frame({'id': req_id, 'result': result}),)
         except Exception as e:
-            return json.dumps({'id': req_id, 'error': f'{type(e).__name__}: {e}'})
+            return (_frame({'id': req_id, 'error': f'{type(e).__name__}: {e}'}),)
 
-    def _call(self, method: str, params: dict[str, Any]) -> str | dict:
+    def _batch(self, calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Run several calls in one round trip, in order.
+
+        Each slot carries its own {result} or {error}, so one failing call
+        doesn't discard the others. Sub-calls go through _call, so the
+        readonly guard still applies per method.
+        """
+        out: list[dict[str, Any]] = []
+        for entry in calls:
+            try:
+                sub_method = entry.get('method', '')
+                if sub_method == 'batch':
+                    raise ValueError('nested batch is not supported')
+                result = self._call(sub_method, entry.get('params') or {})
+                if isinstance(result, _RawResult):  # No raw framing inside a batch
+                    result = result.as_base64()
+                out.append({'result': result})
+            except Exception as e:
+                out.append({'error': f'{type(e).__name__}: {e}'})
+        return out
+
+    def _call(self, method: str, params: dict[str, Any]) -> str | dict | list | _RawResult:
         # Readonly guard — block mutation methods
         if self._readonly and method in _MUTATION_METHODS:
             raise PermissionError('readonly mode — mutation disabled')
@@ -393,6 +617,8 @@ class _Server:
             return 'pong'
         if method == 'version':
             return VERSION
+        if method == 'batch':
+            return self._batch(params.get('calls') or [])
         if method == 'logs':
             after_id = int(params.get('after_id', 0) or 0)
             before_raw = params.get('before_id')
@@ -421,14 +647,8 @@ class _Server:
                     'Screenshot not available — app has not registered a screenshot callback. '
                     'Call devtools.set_screenshot_fn(callback) in the app.'
                 )
-            import base64
             png_bytes = self._run_in_app_context(self._screenshot_fn)
-            return {
-                'format': 'png',
-                'encoding': 'base64',
-                'size': len(png_bytes),
-                'data': base64.b64encode(png_bytes).decode('ascii'),
-            }
+            return _png_result(png_bytes, params)
 
         # Winshot — renders code in an offscreen window, returns PNG
         if method == 'winshot':
@@ -437,75 +657,66 @@ class _Server:
                     'Winshot not available — app has not registered a winshot callback. '
                     'Call devtools.set_winshot_fn(callback) in the app.'
                 )
-            import base64
             code = params.get('code', '')
             fn = self._winshot_fn
             png_bytes = self._run_in_app_context(lambda: fn(code))
-            return {
-                'format': 'png',
-                'encoding': 'base64',
-                'size': len(png_bytes),
-                'data': base64.b64encode(png_bytes).decode('ascii'),
-            }
+            return _png_result(png_bytes, params)
 
         # Resolve methods — run through app context for thread safety
-        from python_devtools._resolve import (
-            call_path,
-            get_source,
-            inspect_object,
-            list_path,
-            list_state,
-            repr_path,
-            run_code,
-            set_value,
-        )
-
+        handler = _HANDLERS.get(method)
+        if handler is None:
+            raise ValueError(f'Unknown method: {method!r}')
         ns = self._namespaces
-        match method:
-            case 'eval':
-                return self._run_in_app_context(lambda: run_code(
-                    params['code'],
-                    ns,
-                    max_result_chars=int(params.get('max_result_chars', 0) or 0),
-                    max_result_lines=int(params.get('max_result_lines', 0) or 0),
-                ))
-            case 'inspect':
-                return self._run_in_app_context(lambda: inspect_object(
-                    params['path'], ns,
-                    max_depth=params.get('max_depth', 2),
-                    max_items=params.get('max_items', 50),
-                    max_repr_len=params.get('max_repr_len', 200),
-                ))
-            case 'source':
-                return self._run_in_app_context(lambda: get_source(params['path'], ns))
-            case 'state':
-                return self._run_in_app_context(lambda: list_state(ns))
-            case 'list':
-                return self._run_in_app_context(lambda: list_path(
-                    params['path'], ns,
-                    max_items=params.get('max_items', 50),
-                    max_repr_len=params.get('max_repr_len', 200),
-                ))
-            case 'repr':
-                return self._run_in_app_context(lambda: repr_path(params['path'], ns))
-            case 'call':
-                return self._run_in_app_context(lambda: call_path(
-                    params['path'], ns,
-                    args=params.get('args'),
-                    kwargs=params.get('kwargs'),
-                ))
-            case 'set':
-                return self._run_in_app_context(lambda: set_value(
-                    params['path'], ns, params['value_expr'],
-                ))
-            case _:
-                raise ValueError(f'Unknown method: {method!r}')
+        return self._run_in_app_context(lambda: handler(params, ns))
+
+
+# Resolve methods: wire name -> handler(params, namespaces). Run by _call
+# through the app context; missing required params raise KeyError.
+_HANDLERS: dict[str, Callable[[dict[str, Any], dict[str, object]], Any]] = {
+    'eval': lambda p, ns: run_code(
+        p['code'],
+        ns,
+        max_result_chars=int(p.get('max_result_chars', 0) or 0),
+        max_result_lines=int(p.get('max_result_lines', 0) or 0),
+    ),
+    'inspect': lambda p, ns: inspect_object(
+        p['path'], ns,
+        max_depth=p.get('max_depth', 2),
+        max_items=p.get('max_items', 50),
+        max_repr_len=p.get('max_repr_len', 200),
+    ),
+    'source': lambda p, ns: get_source(p['path'], ns),
+    'state': lambda p, ns: list_state(ns),
+    'list': lambda p, ns: list_path(
+        p['path'], ns,
+        max_items=p.get('max_items', 50),
+        max_repr_len=p.get('max_repr_len', 200),
+    ),
+    'repr': lambda p, ns: repr_path(p['path'], ns),
+    'call': lambda p, ns: call_path(p['path'], ns, args=p.get('args'), kwargs=p.get('kwargs')),
+    'set': lambda p, ns: set_value(p['path'], ns, p['value_expr']),
+}
 
 
 # ────────────────────────────────────────────────────────────────────
 # Helpers
 # ────────────────────────────────────────────────────────────────────
 
+def _unix_in_use(path: str) -> bool:
+    """Whether something still accepts connections on the Unix socket at path."""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    probe.settimeout(1.0)
+    try:
+        probe.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        return False
+    except OSError:  # Timed out with a full backlog, or unreadable — assume live
+        return True
+    finally:
+        probe.close()
+    return True
+
+
 def _is_loopback(addr: str) -> bool:
     """Check if an address is loopback (127.0.0.0/8 or ::1)."""
     try:
@@ -522,8 +733,9 @@ def start_server(
     *,
     invoke_fn: Callable | None = None,
     readonly: bool = False,
+    unix_path: str | None = None,
 ) -> _Server:
     """Create and start an inspection server. Returns the server instance."""
-    srv = _Server(namespaces, host, port, app_id, invoke_fn=invoke_fn, readonly=readonly)
+    srv = _Server(namespaces, host, port, app_id, invoke_fn=invoke_fn, readonly=readonly, unix_path=unix_path)
     srv.start()
     return srv
@@ -2,13 +2,14 @@
 Wrapper mode — inject devtools into a child Python process via sitecustomize.
 
 Usage:
-    python-devtools [--port PORT] [--app-id APP_ID] [--readonly] -- <command>
+    python-devtools [--port PORT] [--socket PATH] [--app-id APP_ID] [--readonly] -- <command>
 
 Mechanism:
     Prepends a generated sitecustomize.py to PYTHONPATH. When the child
     Python interpreter starts, site.py imports sitecustomize which:
     1. Chains to any existing sitecustomize.py (removes inject dir, imports, restores)
-    2. Starts the devtools TCP server on the configured port
+    2. Starts the devtools TCP server on the configured port (plus a Unix
+       socket listener when --socket is given)
     3. Registers __main__ for inspection (module ref — populated later with script globals)
 
     The python_devtools package itself is also made importable via PYTHONPATH,
@@ -37,6 +38,16 @@ _SITECUSTOMIZE = textwrap.dedent("""\
     # Starts a devtools TCP server in the child process.
     import sys as _sys, os as _os
 
+    # ── Per-process endpoint config ──
+    # Subprocesses (reloaders, `poetry run`-style launchers) get injected too,
+    # each with its own server. Only what can't be shared stays out of their
+    # environment: a fixed port and an explicit socket path. They fall back to
+    # an ephemeral port and their own default socket.
+    _port = _os.environ.get('_DEVTOOLS_PORT', '0')
+    if _port.strip('0'):
+        del _os.environ['_DEVTOOLS_PORT']
+    _socket = _os.environ.pop('_DEVTOOLS_SOCKET', None)
+
     # ── Chain to real sitecustomize ──
     # Remove injection dir so import finds the original (if any)
     _inject = _os.environ.get('_DEVTOOLS_INJECT_DIR', '')
@@ -51,9 +62,10 @@ _SITECUSTOMIZE = textwrap.dedent("""\
     try:
         import python_devtools as _devtools
         _devtools.start(
-            port=int(_os.environ.get('_DEVTOOLS_PORT', '0')),
+            port=int(_port),
             app_id=_os.environ.get('_DEVTOOLS_APP_ID'),
             readonly='_DEVTOOLS_READONLY' in _os.environ,
+            unix_path=_socket or None,
         )
         # __main__ is the module that will hold the user's script globals.
         # We register the object ref now — it gets populated later by the interpreter.
@@ -80,6 +92,7 @@ def wrap(
     port: int = 0,
     app_id: str | None = None,
     readonly: bool = False,
+    unix_path: str | None = None,
 ) -> None:
     """Inject devtools into the child process and exec it. Does not return."""
     if not command:
@@ -109,9 +122,13 @@ def wrap(
     env['_DEVTOOLS_INJECT_DIR'] = inject_dir
     if readonly:
         env['_DEVTOOLS_READONLY'] = '1'
+    if unix_path:
+        env['_DEVTOOLS_SOCKET'] = unix_path
 
     mode = 'readonly' if readonly else 'read-write'
     endpoint = str(port) if port else 'auto'
+    if unix_path:
+        endpoint += f' + {unix_path}'
     print(
         f'python-devtools: wrapping `{" ".join(command)}` — app_id {env["_DEVTOOLS_APP_ID"]}, port {endpoint}, {mode}',
         file=sys.stderr,